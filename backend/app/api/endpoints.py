@@ -1,16 +1,19 @@
 import asyncio
 import json
 import logging
+import queue
 import uuid
-from typing import List
+from typing import List, Optional, Tuple
 from datetime import datetime
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
 
 from app.core.manager import manager
-from app.core.database import get_session, engine
+from app.core.database import get_session, async_session_maker
 from app.core.config import get_settings
+from app.workers.ipc import encode, decode
 from app.models.schema import TranscriptionLog
 from app.models.protocols import (
     ModelInfo, 
@@ -26,6 +29,14 @@ settings = get_settings()
 
 router = APIRouter(tags=["Speech-to-Text"])
 
+# Max outbound messages buffered per WebSocket connection
+WS_SEND_QUEUE_SIZE = 256
+# Outbound coalescing: up to 32 messages collected within a 5ms window share one frame
+WS_BATCH_MAX_SIZE = 32
+WS_BATCH_WINDOW_S = 0.005
+# How long one blocking read on a worker output queue waits before yielding
+RESULT_POLL_TIMEOUT_S = 0.05
+
 @router.get("/api/v1/models", response_model=List[ModelInfo], summary="List available models")
 async def get_models():
     """
@@ -90,6 +101,156 @@ async def get_history(
     result = await session.exec(query)
     return result.all()
 
+def _get_result(q, timeout: float = RESULT_POLL_TIMEOUT_S):
+    """Blocking read from a worker output queue; None if nothing arrived in time.
+    
+    Run via asyncio.to_thread: one thread hop per read, and a result wakes the
+    reader immediately instead of waiting out a sleep-based poll interval.
+    """
+    try:
+        return q.get(timeout=timeout)
+    except queue.Empty:
+        return None
+
+
+def _audio_item(audio_ring, data: bytes):
+    """Worker queue item for an audio chunk.
+    
+    Parks the PCM in a shared-memory slot when one is free so only a small
+    AudioSlot is pickled; falls back to the raw bytes otherwise.
+    """
+    if audio_ring is not None:
+        slot = audio_ring.write(data)
+        if slot is not None:
+            return slot
+    return data
+
+
+async def _enqueue(out_q: asyncio.Queue, message: dict) -> None:
+    """Queue a message for the connection's writer task.
+    
+    Only partial transcripts are dropped when the queue is full, since the
+    next partial or the final supersedes them. Finals, moderation labels and
+    pongs wait for room; _drain keeps consuming even after a send fails.
+    """
+    if "type" not in message and not message.get("is_final"):
+        try:
+            out_q.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("Send queue full, dropping partial transcription")
+        return
+    await out_q.put(message)
+
+
+async def _collect_batch(out_q: asyncio.Queue, first: dict) -> Tuple[List[dict], bool]:
+    """Collect messages queued within WS_BATCH_WINDOW_S after `first`.
+    
+    Returns:
+        Tuple of (batch, stop) where stop is True if the None sentinel was reached.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + WS_BATCH_WINDOW_S
+    batch = [first]
+    
+    while len(batch) < WS_BATCH_MAX_SIZE:
+        try:
+            if out_q.empty():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                message = await asyncio.wait_for(out_q.get(), timeout=remaining)
+            else:
+                message = out_q.get_nowait()
+        except asyncio.TimeoutError:
+            break
+        
+        if message is None:
+            return batch, True
+        batch.append(message)
+    
+    return batch, False
+
+
+def _encode_frame(batch: List[dict]) -> Optional[str]:
+    """Serialize a batch into one WebSocket text frame.
+    
+    Each message is encoded on its own so one that orjson rejects (e.g. an
+    int wider than 64 bits) is dropped without losing the rest of the batch.
+    
+    Returns:
+        The frame text, or None if no message could be encoded.
+    """
+    parts = []
+    for message in batch:
+        try:
+            parts.append(orjson.dumps(message))
+        except TypeError as e:
+            logger.warning(f"Dropping unserializable {message.get('type', 'transcription')} message: {e}")
+    if not parts:
+        return None
+    if len(parts) == 1:
+        return parts[0].decode()
+    return (b'{"events":[' + b",".join(parts) + b"]}").decode()
+
+
+async def _drain(
+    websocket: WebSocket,
+    out_q: asyncio.Queue,
+    ws_closed: asyncio.Event,
+    batched: bool = True,
+) -> None:
+    """Single writer for a WebSocket connection.
+    
+    Transcription, moderation and pong messages are queued by the producer
+    loops and written to the client here, until a None sentinel arrives.
+    When batched, messages queued close together are coalesced into one
+    frame: {"events": [...]}; a lone message is sent unwrapped. Otherwise
+    every message gets its own frame.
+    A message that cannot be serialized is logged and dropped on its own;
+    once a send fails, remaining messages are discarded.
+    """
+    stop = False
+    while not stop:
+        message: Optional[dict] = await out_q.get()
+        if message is None:
+            break
+        
+        if batched:
+            batch, stop = await _collect_batch(out_q, message)
+        else:
+            batch = [message]
+        
+        if ws_closed.is_set():
+            continue
+        
+        frame = _encode_frame(batch)
+        if frame is None:
+            continue
+        try:
+            await websocket.send_text(frame)
+        except Exception as send_err:
+            logger.warning(f"Failed to send message (client disconnected): {send_err}")
+            ws_closed.set()
+
+
+async def _stop_drain(out_q: asyncio.Queue, drain_task: asyncio.Task) -> None:
+    """Stop a connection's writer task and wait for it to finish.
+    
+    Sends the None sentinel when the queue has room, so queued messages are
+    still flushed; cancels the writer instead when the queue is full.
+    """
+    if not drain_task.done():
+        try:
+            out_q.put_nowait(None)
+        except asyncio.QueueFull:
+            drain_task.cancel()
+    try:
+        await drain_task
+    except asyncio.CancelledError:
+        if not drain_task.cancelled():
+            raise
+
+
 @router.websocket("/ws/transcribe")
 async def websocket_endpoint(websocket: WebSocket):
     """
@@ -102,6 +263,9 @@ async def websocket_endpoint(websocket: WebSocket):
     4. Server sends transcription results: {"text": "...", "is_final": bool, "model": "..."}
     5. If content moderation enabled, server sends moderation results: 
        {"type": "moderation", "label": "CLEAN|OFFENSIVE|HATE", "confidence": float, ...}
+    6. Messages produced within a few ms of each other arrive batched in one frame:
+       {"events": [<message>, ...]}. Send "stream_mode": "individual" in the
+       initial config to receive one frame per message instead.
     """
     await websocket.accept()
     
@@ -112,6 +276,8 @@ async def websocket_endpoint(websocket: WebSocket):
     
     # Content moderation state (unified - span detector handles both spans + label inference)
     moderation_enabled = settings.ENABLE_CONTENT_MODERATION
+    # Outbound framing, fixed by the initial config message
+    stream_mode = "batched"
     span_detector_input_q = None
     span_detector_output_q = None
     
@@ -128,12 +294,14 @@ async def websocket_endpoint(websocket: WebSocket):
                     # Allow client to override moderation setting
                     if "moderation" in config:
                         moderation_enabled = config.get("moderation", True)
+                    stream_mode = config.get("stream_mode", stream_mode)
             except json.JSONDecodeError:
                 pass
         
         # Start model process
         manager.start_model(model_name)
         input_q, output_q = manager.get_queues(model_name)
+        audio_ring = manager.get_audio_ring(model_name)
         
         if not input_q or not output_q:
             await websocket.close(code=status.WS_1011_INTERNAL_ERROR, reason="Failed to start model")
@@ -156,10 +324,16 @@ async def websocket_endpoint(websocket: WebSocket):
 
         # If first message was audio, put it in queue
         if "bytes" in first_msg:
-            await asyncio.to_thread(input_q.put, first_msg["bytes"])
+            await asyncio.to_thread(input_q.put, _audio_item(audio_ring, first_msg["bytes"]))
 
+        # Track WebSocket connection state
+        ws_closed = asyncio.Event()
+        
+        # Outbound messages go through one queue drained by a single writer task
+        out_q: asyncio.Queue = asyncio.Queue(maxsize=WS_SEND_QUEUE_SIZE)
+        
         async def receive_audio():
-            nonlocal session_id, model_name, input_q, output_q, moderation_enabled
+            nonlocal session_id, model_name, input_q, output_q, audio_ring, moderation_enabled
             try:
                 audio_packet_count = 0
                 while True:
@@ -175,7 +349,7 @@ async def websocket_endpoint(websocket: WebSocket):
                         if audio_packet_count % 50 == 0:
                             logger.debug(f"Received audio packet #{audio_packet_count}, size: {len(audio_data)} bytes")
                         # Use asyncio.to_thread to avoid blocking event loop
-                        await asyncio.to_thread(input_q.put, audio_data)
+                        await asyncio.to_thread(input_q.put, _audio_item(audio_ring, audio_data))
                         
                     elif "text" in message:
                         try:
@@ -189,6 +363,7 @@ async def websocket_endpoint(websocket: WebSocket):
                                     model_name = new_model
                                     manager.start_model(model_name)
                                     input_q, output_q = manager.get_queues(model_name)
+                                    audio_ring = manager.get_audio_ring(model_name)
                                 # Allow toggling moderation mid-session
                                 if "moderation" in data:
                                     moderation_enabled = data.get("moderation", True)
@@ -235,7 +410,7 @@ async def websocket_endpoint(websocket: WebSocket):
                             elif msg_type == "ping":
                                 # Respond to heartbeat ping with pong
                                 timestamp = data.get("timestamp", 0)
-                                await websocket.send_json({
+                                await _enqueue(out_q, {
                                     "type": "pong",
                                     "timestamp": timestamp
                                 })
@@ -259,9 +434,6 @@ async def websocket_endpoint(websocket: WebSocket):
         # Flag to signal when receive_audio has ended
         receive_ended = asyncio.Event()
         
-        # Track WebSocket connection state
-        ws_closed = asyncio.Event()
-        
         async def send_results():
             nonlocal moderation_enabled
             try:
@@ -273,10 +445,9 @@ async def websocket_endpoint(websocket: WebSocket):
                 while True:
                     # Use asyncio.to_thread for blocking Queue operations
                     try:
-                        # Check if queue has items (non-blocking)
-                        is_empty = await asyncio.to_thread(lambda: output_q.empty())
-                        if not is_empty:
-                            result = await asyncio.to_thread(output_q.get_nowait)
+                        # Blocking read with timeout (wakes as soon as a result lands)
+                        result = await asyncio.to_thread(_get_result, output_q)
+                        if result is not None:
                             result_count += 1
                             empty_checks = 0  # Reset counter when we get data
                             
@@ -285,12 +456,10 @@ async def websocket_endpoint(websocket: WebSocket):
                                 logger.debug("WebSocket already closed, discarding result")
                                 continue  # Continue to drain queue for DB save
                                 
-                            try:
-                                await websocket.send_json(result)
-                                logger.info(f"Sent result #{result_count} to client: '{result.get('text', '')[:50]}...'")
-                            except Exception as send_err:
-                                logger.warning(f"Failed to send result (client disconnected): {send_err}")
-                                ws_closed.set()  # Mark WebSocket as closed on send error
+                            await _enqueue(out_q, result)
+                            # Per-result lines are debug-only (lazy args, no formatting when off);
+                            # the session total is logged once when send_results closes
+                            logger.debug("Queued result #%d for client: '%.50s...'", result_count, result.get("text", ""))
                             
                             # Content moderation: send text to span detector (unified moderation)
                             # Check manager.moderation_enabled for real-time toggle support
@@ -317,8 +486,8 @@ async def websocket_endpoint(websocket: WebSocket):
                                     "is_final": is_final
                                 }
                                 try:
-                                    await asyncio.to_thread(span_detector_input_q.put_nowait, moderation_request)
-                                    logger.info(f"Sent to moderation (final={is_final}): '{text_content[:40]}...'")
+                                    await asyncio.to_thread(span_detector_input_q.put_nowait, encode(moderation_request))
+                                    logger.debug("Sent to moderation (final=%s): '%.40s...'", is_final, text_content)
                                 except Exception as e:
                                     logger.warning(f"Failed to send to moderation: {e}")
                             
@@ -334,13 +503,12 @@ async def websocket_endpoint(websocket: WebSocket):
                                     workflow_type=workflow_type
                                 )
                         else:
-                            # Queue is empty
+                            # Queue stayed empty for RESULT_POLL_TIMEOUT_S
                             if receive_ended.is_set():
                                 empty_checks += 1
                                 if empty_checks >= max_empty_checks:
-                                    logger.info(f"Receive ended and queue empty for {empty_checks * 50}ms, closing send_results")
+                                    logger.info(f"Receive ended and queue empty for {empty_checks * 50}ms, closing send_results ({result_count} results)")
                                     break
-                            await asyncio.sleep(0.05)  # 50ms polling interval
                             
                     except Exception as e:
                         if "Empty" not in str(type(e).__name__):
@@ -376,9 +544,9 @@ async def websocket_endpoint(websocket: WebSocket):
                         continue
                         
                     try:
-                        is_empty = await asyncio.to_thread(lambda: span_detector_output_q.empty())
-                        if not is_empty:
-                            moderation_result = await asyncio.to_thread(span_detector_output_q.get_nowait)
+                        moderation_result = await asyncio.to_thread(_get_result, span_detector_output_q)
+                        if moderation_result is not None:
+                            moderation_result = decode(moderation_result)
                             
                             if ws_closed.is_set():
                                 logger.debug("WebSocket closed, discarding moderation result")
@@ -407,32 +575,23 @@ async def websocket_endpoint(websocket: WebSocket):
                                 "spans": spans
                             }
                             
-                            try:
-                                await websocket.send_json(client_result)
-                                flagged_str = "⚠️ FLAGGED" if is_flagged else ""
-                                keywords_str = ""
-                                if detected_keywords:
-                                    keywords_str = f" [{', '.join(detected_keywords[:3])}]"
-                                    if len(detected_keywords) > 3:
-                                        keywords_str = f" [{', '.join(detected_keywords[:3])}... (+{len(detected_keywords)-3})]"
-                                logger.info(f"Sent moderation: {label} ({confidence:.1%}) {flagged_str}{keywords_str}")
-                                
-                                # Save moderation to DB
-                                if session_id:
-                                    await _save_transcription(
-                                        session_id=session_id,
-                                        model_id=model_name,
-                                        content="",  # Content already saved by send_results
-                                        moderation_label=label,
-                                        moderation_confidence=confidence,
-                                        is_flagged=is_flagged,
-                                        detected_keywords=detected_keywords
-                                    )
-                            except Exception as send_err:
-                                logger.warning(f"Failed to send moderation result: {send_err}")
-                                ws_closed.set()
-                        else:
-                            await asyncio.sleep(0.05)
+                            await _enqueue(out_q, client_result)
+                            logger.debug(
+                                "Queued moderation: %s (%.1f%%) flagged=%s keywords=%s",
+                                label, confidence * 100, is_flagged, detected_keywords,
+                            )
+                            
+                            # Save moderation to DB
+                            if session_id:
+                                await _save_transcription(
+                                    session_id=session_id,
+                                    model_id=model_name,
+                                    content="",  # Content already saved by send_results
+                                    moderation_label=label,
+                                    moderation_confidence=confidence,
+                                    is_flagged=is_flagged,
+                                    detected_keywords=detected_keywords
+                                )
                             
                         # Exit if receive ended and no more results expected
                         if receive_ended.is_set():
@@ -450,41 +609,48 @@ async def websocket_endpoint(websocket: WebSocket):
             except Exception as e:
                 logger.error(f"Error in moderation results loop: {e}", exc_info=True)
 
-        # Run tasks concurrently (3 tasks instead of 4)
-        receive_task = asyncio.create_task(receive_audio())
-        send_task = asyncio.create_task(send_results())
-        # Create unified moderation task if span detector queues exist
-        moderation_task = asyncio.create_task(send_moderation_results()) if span_detector_output_q else None
-        
-        # Wait for receive to finish first (client disconnect or error)
-        await receive_task
-        
-        # Now wait for send_results to drain the queue (with timeout)
+        # Run tasks concurrently (producers + single writer)
+        drain_task = asyncio.create_task(
+            _drain(websocket, out_q, ws_closed, batched=stream_mode != "individual")
+        )
         try:
-            # Give send_results up to 15 seconds to drain remaining results
-            await asyncio.wait_for(send_task, timeout=15.0)
-            logger.info("send_results completed successfully")
-        except asyncio.TimeoutError:
-            logger.warning("send_results timed out after 15s, cancelling")
-            send_task.cancel()
-            try:
-                await send_task
-            except asyncio.CancelledError:
-                pass
-        
-        # Wait for moderation task if it was created
-        if moderation_task:
+            receive_task = asyncio.create_task(receive_audio())
+            send_task = asyncio.create_task(send_results())
+            # Create unified moderation task if span detector queues exist
+            moderation_task = asyncio.create_task(send_moderation_results()) if span_detector_output_q else None
+            
+            # Wait for receive to finish first (client disconnect or error)
+            await receive_task
+            
+            # Now wait for send_results to drain the queue (with timeout)
             try:
-                await asyncio.wait_for(moderation_task, timeout=5.0)
-                logger.info("moderation task completed successfully")
+                # Give send_results up to 15 seconds to drain remaining results
+                await asyncio.wait_for(send_task, timeout=15.0)
+                logger.info("send_results completed successfully")
             except asyncio.TimeoutError:
-                logger.warning("moderation task timed out, cancelling")
-                moderation_task.cancel()
+                logger.warning("send_results timed out after 15s, cancelling")
+                send_task.cancel()
                 try:
-                    await moderation_task
+                    await send_task
                 except asyncio.CancelledError:
                     pass
             
+            # Wait for moderation task if it was created
+            if moderation_task:
+                try:
+                    await asyncio.wait_for(moderation_task, timeout=5.0)
+                    logger.info("moderation task completed successfully")
+                except asyncio.TimeoutError:
+                    logger.warning("moderation task timed out, cancelling")
+                    moderation_task.cancel()
+                    try:
+                        await moderation_task
+                    except asyncio.CancelledError:
+                        pass
+        finally:
+            # Stop the writer on every exit path, including cancellation
+            await _stop_drain(out_q, drain_task)
+            
     except WebSocketDisconnect:
         logger.info("WebSocket disconnected")
     except Exception as e:
@@ -518,13 +684,7 @@ async def _save_transcription(
         is_flagged: Whether content was flagged (optional)
         detected_keywords: List of detected bad keywords (optional)
     """
-    from sqlalchemy.orm import sessionmaker
-    
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-    
-    async with async_session() as session:
+    async with async_session_maker() as session:
         try:
             # Check if log exists for this session
             statement = select(TranscriptionLog).where(TranscriptionLog.session_id == session_id)
@@ -615,7 +775,8 @@ async def get_model_status():
     status = manager.get_status()
     
     return ModelStatus(
-        current_model=loading_model if status == "loading" else current_model,
+        # A started worker that is still loading has no loading_model; report it as current
+        current_model=loading_model or current_model,
         is_loaded=status == "ready",
         status=status
     )
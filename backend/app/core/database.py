@@ -1,7 +1,6 @@
 import logging
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel, text
 from app.core.config import settings
 
@@ -16,6 +15,11 @@ engine = create_async_engine(
     pool_pre_ping=True,  # Check connection health
 )
 
+# Session factory built once and shared by request handlers and WS writers
+async_session_maker = async_sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False
+)
+
 
 async def create_db_and_tables():
     """Create database tables and configure SQLite settings."""
@@ -35,10 +39,7 @@ async def create_db_and_tables():
 
 async def get_session():
     """Dependency that provides an async database session."""
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-    async with async_session() as session:
+    async with async_session_maker() as session:
         try:
             yield session
         finally:
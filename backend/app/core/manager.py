@@ -1,8 +1,11 @@
+import asyncio
 import logging
 import multiprocessing
+import multiprocessing.synchronize
 import threading
 from typing import Dict, Optional, Tuple
 from app.workers.base import BaseWorker
+from app.workers.shared_audio import SharedAudioRing
 
 logger = logging.getLogger(__name__)
 
@@ -26,11 +29,26 @@ class ModelManager:
     VALID_MODELS = ["zipformer"]
     VALID_SPAN_DETECTORS = ["visobert-hsd-span"]
     
+    # Shutdown bounds (seconds): graceful join after STOP, then join after terminate()
+    STOP_JOIN_TIMEOUT = 2.0
+    TERMINATE_JOIN_TIMEOUT = 0.5
+    
+    # Worker processes (STT and span detector) start from a forkserver (a clean
+    # interpreter) rather than fork()ing the parent with its loaded models and
+    # server state.
+    # Platforms without forkserver (Windows) fall back to spawn.
+    SPAN_DETECTOR_START_METHOD = (
+        "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    )
+    
     def __init__(self):
         # STT model resources
         self.active_processes: Dict[str, multiprocessing.Process] = {}
         self.input_queues: Dict[str, multiprocessing.Queue] = {}
         self.output_queues: Dict[str, multiprocessing.Queue] = {}
+        self.ready_events: Dict[str, multiprocessing.synchronize.Event] = {}
+        # Shared-memory audio slots, so PCM chunks are not pickled per put()
+        self.audio_rings: Dict[str, SharedAudioRing] = {}
         self.current_model: Optional[str] = None
         
         # Span detector resources (unified moderation - span extraction + label inference)
@@ -38,6 +56,7 @@ class ModelManager:
         self.span_detector_input_queue: Optional[multiprocessing.Queue] = None
         self.span_detector_output_queue: Optional[multiprocessing.Queue] = None
         self.current_span_detector: Optional[str] = None
+        self._mp_ctx = multiprocessing.get_context(self.SPAN_DETECTOR_START_METHOD)
         
         # Initialize from settings - actual moderation only works when detector is loaded
         from app.core.config import settings
@@ -85,7 +104,8 @@ class ModelManager:
             if self._loading_model or self._loading_span_detector:
                 return "loading"
             elif self.current_model and self.current_model in self.active_processes:
-                return "ready"
+                # The process is up, but the model is only usable once the worker signals it loaded
+                return "ready" if self.is_model_ready(self.current_model) else "loading"
             else:
                 return "idle"
 
@@ -106,21 +126,28 @@ class ModelManager:
             self.stop_current_model()
 
             logger.info(f"Starting model: {model_name}")
-            input_q = multiprocessing.Queue(maxsize=100)  # Limit queue size
-            output_q = multiprocessing.Queue(maxsize=100)
+            input_q = self._mp_ctx.Queue(maxsize=100)  # Limit queue size
+            output_q = self._mp_ctx.Queue(maxsize=100)
             
             worker_class = self._get_worker_class(model_name)
             if not worker_class:
                 raise ValueError(f"No worker implementation for model: {model_name}")
             
-            worker = worker_class(input_q, output_q, model_name)
+            ready_event = self._mp_ctx.Event()
+            audio_ring = SharedAudioRing(ctx=self._mp_ctx)
+            worker = worker_class(
+                input_q, output_q, model_name,
+                ready_event=ready_event, audio_ring=audio_ring
+            )
             
-            process = multiprocessing.Process(target=worker.run, daemon=True)
+            process = self._mp_ctx.Process(target=worker.run, daemon=True)
             process.start()
             
             self.active_processes[model_name] = process
             self.input_queues[model_name] = input_q
             self.output_queues[model_name] = output_q
+            self.ready_events[model_name] = ready_event
+            self.audio_rings[model_name] = audio_ring
             self.current_model = model_name
             
             logger.info(f"Model {model_name} started (PID: {process.pid})")
@@ -146,12 +173,12 @@ class ModelManager:
         
         # Wait for graceful shutdown
         process = self.active_processes[model_name]
-        process.join(timeout=10)
+        process.join(timeout=self.STOP_JOIN_TIMEOUT)
         
         if process.is_alive():
             logger.warning(f"Model {model_name} did not stop gracefully, terminating")
             process.terminate()
-            process.join(timeout=5)
+            process.join(timeout=self.TERMINATE_JOIN_TIMEOUT)
             
             if process.is_alive():
                 logger.error(f"Model {model_name} still alive after terminate, killing")
@@ -171,12 +198,18 @@ class ModelManager:
         # Stop span detector (unified moderation)
         self.stop_span_detector()
 
+    async def astop_all_models(self) -> None:
+        """Stop all workers without blocking the event loop on process joins."""
+        await asyncio.to_thread(self.stop_all_models)
+
     def preload_all_models(self) -> None:
         """Pre-load all models on startup for faster first request.
         
         This eliminates cold-start latency by loading:
         - Zipformer STT model
-        - ViSoBERT-HSD-Span detector (unified moderation with label inference)
+        - ViSoBERT-HSD-Span detector (unified moderation with label inference),
+          only when moderation is enabled by default. Otherwise it is left
+          unloaded until a client or the toggle endpoint turns moderation on.
         """
         logger.info("Pre-loading all models for faster startup...")
         
@@ -187,6 +220,10 @@ class ModelManager:
         except Exception as e:
             logger.error(f"✗ Failed to pre-load Zipformer: {e}")
         
+        if not self._moderation_enabled:
+            logger.info("Moderation disabled, span detector will load on first use")
+            return
+        
         # Load span detector (now handles both span extraction AND label inference)
         try:
             self.start_span_detector("visobert-hsd-span")
@@ -202,6 +239,17 @@ class ModelManager:
             return None, None
         return self.input_queues.get(model_name), self.output_queues.get(model_name)
 
+    def get_audio_ring(self, model_name: str) -> Optional[SharedAudioRing]:
+        """Get the shared-memory audio ring feeding a model's worker."""
+        if model_name != self.current_model:
+            return None
+        return self.audio_rings.get(model_name)
+
+    def is_model_ready(self, model_name: str) -> bool:
+        """Check whether a model worker has finished loading its model."""
+        event = self.ready_events.get(model_name)
+        return event is not None and event.is_set()
+
     def set_moderation_enabled(self, enabled: bool) -> None:
         """Enable or disable content moderation without stopping the detector."""
         self._moderation_enabled = enabled
@@ -211,6 +259,14 @@ class ModelManager:
         """Clean up resources for a model."""
         if model_name in self.active_processes:
             del self.active_processes[model_name]
+        self.ready_events.pop(model_name, None)
+        audio_ring = self.audio_rings.pop(model_name, None)
+        if audio_ring is not None:
+            try:
+                audio_ring.close()
+                audio_ring.unlink()
+            except Exception:
+                pass
         if model_name in self.input_queues:
             try:
                 self.input_queues[model_name].close()
@@ -255,8 +311,8 @@ class ModelManager:
             self.stop_span_detector()
             
             logger.info(f"Starting span detector: {detector_name}")
-            input_q = multiprocessing.Queue(maxsize=100)
-            output_q = multiprocessing.Queue(maxsize=100)
+            input_q = self._mp_ctx.Queue(maxsize=100)
+            output_q = self._mp_ctx.Queue(maxsize=100)
             
             span_detector_class = self._get_span_detector_class(detector_name)
             if not span_detector_class:
@@ -264,7 +320,7 @@ class ModelManager:
             
             worker = span_detector_class(input_q, output_q, detector_name)
             
-            process = multiprocessing.Process(target=worker.run, daemon=True)
+            process = self._mp_ctx.Process(target=worker.run, daemon=True)
             process.start()
             
             self.span_detector_process = process
@@ -295,12 +351,12 @@ class ModelManager:
         
         # Wait for graceful shutdown
         process = self.span_detector_process
-        process.join(timeout=10)
+        process.join(timeout=self.STOP_JOIN_TIMEOUT)
         
         if process.is_alive():
             logger.warning(f"Span detector {detector_name} did not stop gracefully, terminating")
             process.terminate()
-            process.join(timeout=5)
+            process.join(timeout=self.TERMINATE_JOIN_TIMEOUT)
             
             if process.is_alive():
                 logger.error(f"Span detector {detector_name} still alive after terminate, killing")
@@ -2,8 +2,10 @@
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AudioData:
     """
     Immutable value object representing audio data.
@@ -25,11 +27,11 @@ class AudioData:
     format: str
     duration_ms: Optional[float] = None
     
-    # Supported formats
-    SUPPORTED_FORMATS = {'pcm', 'wav', 'mp3', 'flac', 'ogg'}
+    # Supported formats (tuple: shared and immutable, stable order in messages)
+    SUPPORTED_FORMATS = ('pcm', 'wav', 'mp3', 'flac', 'ogg')
     
     # Standard sample rates
-    STANDARD_SAMPLE_RATES = {8000, 16000, 22050, 32000, 44100, 48000}
+    STANDARD_SAMPLE_RATES = (8000, 16000, 22050, 32000, 44100, 48000)
     
     def __post_init__(self) -> None:
         """Validate audio data after initialization."""
@@ -63,6 +65,21 @@ class AudioData:
         """Check if audio is stereo (two channels)."""
         return self.channels == 2
     
+    @property
+    def pcm(self) -> np.ndarray:
+        """
+        Zero-copy int16 view over PCM data.
+        
+        Returns:
+            Read-only int16 array sharing memory with `data`.
+        
+        Raises:
+            ValueError: If the audio is not raw PCM.
+        """
+        if self.format.lower() != 'pcm':
+            raise ValueError(f"PCM view requires 'pcm' format, got {self.format}")
+        return np.frombuffer(self.data, dtype=np.int16)
+    
     def get_size_bytes(self) -> int:
         """Get size of audio data in bytes."""
         return len(self.data)
@@ -21,6 +21,10 @@ class Container(containers.DeclarativeContainer):
     )
     
     # Database (placeholder - will be implemented in Phase 2)
+    # Only the repositories depend on the DB resource. The workers below are
+    # independent of it and of each other, so init_resources() can start
+    # them concurrently, as the app lifespan already overlaps model preload
+    # with create_db_and_tables().
     # db_session = providers.Resource(
     #     get_async_session,
     #     database_url=settings.provided.database_url,
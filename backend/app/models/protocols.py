@@ -119,3 +119,6 @@ class WebSocketConfig(BaseModel):
     sample_rate: int = 16000
     # Content moderation settings
     moderation: bool = True  # Enable/disable moderation for this session
+    # "batched": messages produced together share one {"events": [...]} frame;
+    # "individual": every message is sent as its own frame
+    stream_mode: Literal["batched", "individual"] = "batched"
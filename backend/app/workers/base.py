@@ -1,7 +1,10 @@
 import logging
 import multiprocessing
+import multiprocessing.synchronize
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import deque
+from queue import Empty
+from typing import Any, Deque, Dict, Optional
 
 # Configure logging for worker processes
 logging.basicConfig(
@@ -22,24 +25,43 @@ class BaseWorker(ABC):
         self, 
         input_queue: multiprocessing.Queue, 
         output_queue: multiprocessing.Queue, 
-        model_name: str
+        model_name: str,
+        ready_event: Optional[multiprocessing.synchronize.Event] = None,
     ):
         self.input_queue = input_queue
         self.output_queue = output_queue
         self.model_name = model_name
+        # Set by the child process once load_model() succeeds
+        self.ready_event = ready_event
         self.is_running = True
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Items pulled ahead by process() (e.g. while coalescing) that still
+        # need their own turn; consumed before reading the input queue again.
+        self._backlog: Deque[Any] = deque()
 
     @abstractmethod
     def load_model(self) -> None:
         """Load the AI model into memory. Must be implemented by subclasses."""
         pass
 
+    def warmup(self) -> None:
+        """Run one throwaway inference so the first real request skips
+        lazy kernel/arena initialisation. No-op by default."""
+        pass
+
     @abstractmethod
     def process(self, audio_data: Any) -> None:
         """Process audio data and put result in output_queue. Must be implemented by subclasses."""
         pass
 
+    def put_result(self, result: Dict[str, Any]) -> None:
+        """Put one result on the output queue in this worker's wire format.
+        
+        Plain dicts by default; workers speaking the orjson IPC codec
+        override this so error results are encoded like regular ones.
+        """
+        self.output_queue.put(result)
+
     def run(self) -> None:
         """Main loop for the worker process."""
         self.logger.info(f"Worker starting...")
@@ -47,11 +69,17 @@ class BaseWorker(ABC):
         try:
             self.load_model()
             self.logger.info("Model loaded successfully")
+            self.warmup()
+            if self.ready_event is not None:
+                self.ready_event.set()
             
             while self.is_running:
                 try:
-                    # Get data from input queue with timeout
-                    item = self.input_queue.get(timeout=1.0)
+                    # Get data from backlog first, then input queue with timeout
+                    if self._backlog:
+                        item = self._backlog.popleft()
+                    else:
+                        item = self.input_queue.get(timeout=1.0)
                     
                     if item == "STOP":
                         self.logger.info("Received stop signal")
@@ -60,11 +88,11 @@ class BaseWorker(ABC):
                     
                     self.process(item)
                     
-                except multiprocessing.queues.Empty:
+                except Empty:
                     continue
                 except Exception as e:
                     self.logger.error(f"Error processing item: {e}", exc_info=True)
-                    self.output_queue.put({"error": str(e), "model": self.model_name})
+                    self.put_result({"error": str(e), "model": self.model_name})
                     
         except Exception as e:
             self.logger.error(f"Fatal error: {e}", exc_info=True)
@@ -0,0 +1,14 @@
+"""
+IPC codec for worker text payloads.
+
+Span detector requests and results cross the process boundary as
+orjson-encoded bytes instead of pickled dicts. Both the API side and
+the workers import the codec from here so the wire format has a single
+definition.
+"""
+import orjson
+
+encode = orjson.dumps
+decode = orjson.loads
+
+__all__ = ["encode", "decode"]
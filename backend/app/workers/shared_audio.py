@@ -0,0 +1,99 @@
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+
+class AudioSlot(NamedTuple):
+    """Reference to PCM audio parked in a SharedAudioRing slot."""
+    index: int
+    nbytes: int
+
+
+class SharedAudioRing:
+    """Fixed pool of shared-memory slots for handing PCM audio to a worker.
+
+    The WebSocket handler copies each chunk into a free slot and puts only
+    the small AudioSlot on the worker's input queue; the worker reads the
+    samples straight out of shared memory and marks the slot free again.
+    Slot ownership lives in a lock-guarded shared flag array, so a release
+    is visible to the writer immediately. When no slot is free (or a chunk
+    is too large for one) write() returns None and the caller sends the
+    raw bytes as before. The same fallback applies once the ring is closed,
+    since open connections keep their reference across a model stop.
+    """
+
+    # 64 slots x 64000 bytes = 2s of 16kHz Int16 audio per slot, ~4MB total
+    N_SLOTS = 64
+    BYTES_PER_SLOT = 64000
+
+    def __init__(
+        self,
+        n_slots: int = N_SLOTS,
+        bytes_per_slot: int = BYTES_PER_SLOT,
+        ctx=multiprocessing,
+    ):
+        self.n_slots = n_slots
+        self.bytes_per_slot = bytes_per_slot
+        self._shm = shared_memory.SharedMemory(create=True, size=n_slots * bytes_per_slot)
+        # 1 = slot holds audio not yet read by the worker
+        self._in_use = ctx.Array("b", n_slots)
+        # Writer-side scan start, so slots are reused round-robin
+        self._next = 0
+        self._closed = False
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def write(self, data: bytes) -> Optional[AudioSlot]:
+        """Copy audio into a free slot without blocking.
+
+        Returns:
+            AudioSlot for the queue, or None if the chunk does not fit,
+            every slot is in use or the ring has been closed
+        """
+        nbytes = len(data)
+        if self._closed or nbytes > self.bytes_per_slot:
+            return None
+        index = self._acquire()
+        if index is None:
+            return None
+        offset = index * self.bytes_per_slot
+        self._shm.buf[offset:offset + nbytes] = data
+        return AudioSlot(index, nbytes)
+
+    def _acquire(self) -> Optional[int]:
+        """Claim the next free slot index, or None if all are in use."""
+        with self._in_use.get_lock():
+            for step in range(self.n_slots):
+                index = (self._next + step) % self.n_slots
+                if not self._in_use[index]:
+                    self._in_use[index] = 1
+                    self._next = (index + 1) % self.n_slots
+                    return index
+        return None
+
+    def view(self, slot: AudioSlot) -> np.ndarray:
+        """Int16 samples of a slot as a zero-copy view into shared memory."""
+        return np.frombuffer(
+            self._shm.buf,
+            dtype=np.int16,
+            count=slot.nbytes // 2,
+            offset=slot.index * self.bytes_per_slot,
+        )
+
+    def release(self, slot: AudioSlot) -> None:
+        """Mark a slot free once its samples have been copied out."""
+        with self._in_use.get_lock():
+            self._in_use[slot.index] = 0
+
+    def close(self) -> None:
+        """Detach this process from the shared memory block."""
+        self._closed = True
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block (owner process only)."""
+        self._shm.unlink()
@@ -1,8 +1,17 @@
 import os
 import time
+from queue import Empty
+from typing import List, Optional, Union
+
 import numpy as np
 
+try:
+    import sherpa_onnx
+except ImportError:  # optional at import time; load_model() reports it
+    sherpa_onnx = None
+
 from app.workers.base import BaseWorker
+from app.workers.shared_audio import AudioSlot, SharedAudioRing
 from app.core.config import settings
 
 
@@ -12,10 +21,36 @@ class ZipformerWorker(BaseWorker):
     Zipformer is a streaming RNN-T model that produces incremental results.
     To avoid flooding the client with duplicate results, we only send updates
     when the transcription text actually changes.
+    
+    Audio chunks that pile up in the input queue while a decode is running
+    are coalesced into one accept_waveform/decode_stream call, so a backlog
+    costs a single decode instead of one per chunk.
+    
+    Audio arrives either as raw Int16 bytes or as an AudioSlot pointing
+    into the shared `audio_ring`; slots are read in place and released as
+    soon as their samples have been converted.
     """
     
+    # Upper bound on queued audio chunks merged into a single decode
+    MAX_COALESCED_CHUNKS = 16
+    
+    def __init__(
+        self,
+        input_queue,
+        output_queue,
+        model_name: str,
+        ready_event=None,
+        audio_ring: Optional[SharedAudioRing] = None,
+    ):
+        super().__init__(input_queue, output_queue, model_name, ready_event)
+        self.audio_ring = audio_ring
+        self.recognizer = None
+        self.stream = None
+        self.last_text = ""
+    
     def load_model(self):
-        import sherpa_onnx
+        if sherpa_onnx is None:
+            raise ModuleNotFoundError("No module named 'sherpa_onnx'", name="sherpa_onnx")
         
         # Use settings for model path
         base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
@@ -54,6 +89,20 @@ class ZipformerWorker(BaseWorker):
             self.recognizer = None
             raise
 
+    def warmup(self) -> None:
+        """Decode 1s of silence on a throwaway stream.
+        
+        The first decode pays for ONNX Runtime kernel/arena setup; doing it
+        here keeps that cost out of the first user-facing result. The live
+        stream and deduplication state are left untouched.
+        """
+        if self.recognizer is None:
+            return
+        stream = self.recognizer.create_stream()
+        stream.accept_waveform(16000, np.zeros(16000, dtype=np.float32))
+        self.recognizer.decode_stream(stream)
+        self.logger.debug("Zipformer warmup decode done")
+
     def format_vietnamese_text(self, text: str) -> str:
         """Convert text to Sentence case."""
         if not text:
@@ -63,8 +112,46 @@ class ZipformerWorker(BaseWorker):
             text = text[0].upper() + text[1:]
         return text
 
+    def _drain_pending_audio(self) -> List[Union[bytes, AudioSlot]]:
+        """Take raw audio chunks already waiting in the input queue.
+        
+        Never blocks. Stops at the first non-audio item (reset/flush/STOP),
+        which is put on the backlog so it runs after the merged decode.
+        """
+        chunks = []
+        while len(chunks) < self.MAX_COALESCED_CHUNKS - 1:
+            try:
+                item = self.input_queue.get_nowait()
+            except Empty:
+                break
+            if not isinstance(item, (bytes, AudioSlot)):
+                self._backlog.append(item)
+                break
+            chunks.append(item)
+        return chunks
+
+    def _to_float32(self, chunks: List[Union[bytes, AudioSlot]]) -> np.ndarray:
+        """Convert Int16 chunks to normalized float32 in a single pass.
+        
+        Shared-memory slots are read in place and released afterwards.
+        """
+        try:
+            pcm = [
+                self.audio_ring.view(chunk) if isinstance(chunk, AudioSlot)
+                else np.frombuffer(chunk, dtype=np.int16)
+                for chunk in chunks
+            ]
+            pcm = pcm[0] if len(pcm) == 1 else np.concatenate(pcm)
+            return np.multiply(pcm, 1.0 / 32768.0, dtype=np.float32)
+        finally:
+            for chunk in chunks:
+                if isinstance(chunk, AudioSlot):
+                    self.audio_ring.release(chunk)
+
     def process(self, item):
         if not self.recognizer:
+            if isinstance(item, AudioSlot):
+                self.audio_ring.release(item)
             return
 
         force_output = False
@@ -88,9 +175,12 @@ class ZipformerWorker(BaseWorker):
             # Start timing for latency measurement
             start_time = time.perf_counter()
             
-            # Convert bytes (int16) to float32 normalized
-            samples = np.frombuffer(audio_data, dtype=np.int16)
-            samples = samples.astype(np.float32) / 32768.0
+            # Merge chunks queued behind this one (not past a flush boundary)
+            chunks = [audio_data]
+            if not force_output and not self._backlog:
+                chunks.extend(self._drain_pending_audio())
+            
+            samples = self._to_float32(chunks)
             
             self.stream.accept_waveform(16000, samples)
             self.recognizer.decode_stream(self.stream)
@@ -112,7 +202,7 @@ class ZipformerWorker(BaseWorker):
                     "latency_ms": round(latency_ms, 2)
                 }
                 
-                self.output_queue.put(result)
+                self.put_result(result)
         
         # Handle flush: output final result and reset stream
         if force_output:
@@ -127,7 +217,7 @@ class ZipformerWorker(BaseWorker):
                     "workflow_type": "streaming",  # Streaming = text contains full transcription
                     "latency_ms": 0
                 }
-                self.output_queue.put(result)
+                self.put_result(result)
                 self.logger.info(f"Flush output: '{formatted_text[:50]}...'")
             
             # Reset stream and last_text to prevent accumulation in next session
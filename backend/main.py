@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
@@ -20,21 +21,23 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager for startup and shutdown."""
     # Startup
     logger.info(f"Starting {settings.PROJECT_NAME}...")
-    await create_db_and_tables()
     
     # Pre-load all models for faster first request
-    # Run in thread to not block startup (models load in background)
-    import asyncio
-    loop = asyncio.get_event_loop()
+    # Run in thread to not block startup (models load in background).
+    # Kicked off before DB setup so worker processes begin loading their
+    # models while the tables are created, instead of one after the other.
+    loop = asyncio.get_running_loop()
     loop.run_in_executor(None, manager.preload_all_models)
     
+    await create_db_and_tables()
+    
     logger.info("Application started successfully (models loading in background)")
     
     yield
     
     # Shutdown
     logger.info("Shutting down...")
-    manager.stop_all_models()
+    await manager.astop_all_models()
     logger.info("Application shutdown complete")
 
 
@@ -0,0 +1,31 @@
+"""
+Deterministic synthetic audio for tests and benchmarks.
+
+Silence can hit decoder fast paths, and fresh np.random buffers change on
+every run and cost an RNG call per chunk. synthetic_pcm() returns seeded
+pseudo-noise, generated once per argument set and reused. SILENCE_1S and
+SILENCE_HALF_S are shared zero buffers for tests that do want silence.
+"""
+import functools
+
+import numpy as np
+
+# Silence (16kHz int16 mono); bytes are immutable, so one buffer serves every test
+SILENCE_1S = bytes(16000 * 2)
+SILENCE_HALF_S = bytes(16000)
+
+
+@functools.lru_cache(maxsize=16)
+def synthetic_pcm(
+    duration_ms: int = 1000,
+    sample_rate: int = 16000,
+    seed: int = 42,
+    amplitude: int = 16000,
+) -> bytes:
+    """Seeded pseudo-noise PCM (int16, mono) of the given duration.
+    
+    Returns immutable bytes, so the cached buffer is safe to share.
+    """
+    rng = np.random.default_rng(seed)
+    num_samples = sample_rate * duration_ms // 1000
+    return rng.integers(-amplitude, amplitude, num_samples, dtype=np.int16).tobytes()
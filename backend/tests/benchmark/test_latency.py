@@ -17,6 +17,8 @@ import numpy as np
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 
+from tests.ws_frames import ws_events
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -80,7 +82,6 @@ class TestWebSocketLatencyBenchmark:
     
     @pytest.mark.e2e
     @pytest.mark.benchmark
-    @pytest.mark.asyncio
     @pytest.mark.parametrize("model_name", MODELS)
     async def test_latency_benchmark(self, model_name, results_log):
         """
@@ -132,16 +133,15 @@ class TestWebSocketLatencyBenchmark:
                                 timeout=15.0  # Longer timeout for slow models
                             )
                             recv_time = time.time()
-                            data = json.loads(msg)
-                            
-                            if data.get("text"):
-                                latency = recv_time - start_time
-                                latencies.append(latency)
-                                messages_received.append({
-                                    "text": data["text"],
-                                    "latency": latency,
-                                    "is_final": data.get("is_final", False)
-                                })
+                            for data in ws_events(msg):
+                                if data.get("text"):
+                                    latency = recv_time - start_time
+                                    latencies.append(latency)
+                                    messages_received.append({
+                                        "text": data["text"],
+                                        "latency": latency,
+                                        "is_final": data.get("is_final", False)
+                                    })
                     except asyncio.TimeoutError:
                         pass
                     except Exception as e:
@@ -214,7 +214,6 @@ class TestStreamingLatency:
     
     @pytest.mark.e2e
     @pytest.mark.benchmark
-    @pytest.mark.asyncio
     async def test_first_result_latency(self):
         """Measure time to first transcription result."""
         import websockets
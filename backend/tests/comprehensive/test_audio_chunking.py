@@ -14,10 +14,6 @@ Based on research:
 """
 import pytest
 import numpy as np
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 
 
 class TestAudioChunking:
@@ -12,18 +12,13 @@ Run with: pytest tests/comprehensive/test_performance.py -v -s -m slow
 """
 import pytest
 import numpy as np
-import multiprocessing
+import queue
 import time
-import sys
-import os
 import threading
 from unittest.mock import patch, MagicMock
 from concurrent.futures import ThreadPoolExecutor
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
-
-from fastapi.testclient import TestClient
-from main import app
+from tests.audio_samples import synthetic_pcm
 
 
 class TestRealTimePerformance:
@@ -38,23 +33,22 @@ class TestRealTimePerformance:
         """Create and load Zipformer worker."""
         from app.workers.zipformer import ZipformerWorker
         
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
+        input_q = queue.Queue()
+        output_q = queue.Queue()
         worker = ZipformerWorker(input_q, output_q, "zipformer")
         
         try:
             worker.load_model()
         except FileNotFoundError:
             pytest.skip("Model files not found")
+        worker.warmup()
         
         yield worker
-        input_q.close()
-        output_q.close()
     
     @pytest.mark.slow
     def test_single_chunk_latency(self, loaded_worker):
         """Measure latency for processing a single chunk."""
-        chunk = np.random.randint(-500, 500, self.CHUNK_SIZE, dtype=np.int16).tobytes()
+        chunk = synthetic_pcm(int(self.CHUNK_DURATION_MS), amplitude=500)
         
         latencies = []
         for _ in range(20):
@@ -87,7 +81,7 @@ class TestRealTimePerformance:
         start_time = time.perf_counter()
         
         for _ in range(chunks_needed):
-            chunk = np.random.randint(-500, 500, self.CHUNK_SIZE, dtype=np.int16).tobytes()
+            chunk = synthetic_pcm(int(self.CHUNK_DURATION_MS), amplitude=500)
             
             chunk_start = time.perf_counter()
             loaded_worker.process(chunk)
@@ -114,7 +108,7 @@ class TestRealTimePerformance:
     @pytest.mark.slow
     def test_latency_consistency(self, loaded_worker):
         """Test latency variance (jitter)."""
-        chunk = np.random.randint(-500, 500, self.CHUNK_SIZE, dtype=np.int16).tobytes()
+        chunk = synthetic_pcm(int(self.CHUNK_DURATION_MS), amplitude=500)
         
         latencies = []
         for _ in range(50):
@@ -144,18 +138,17 @@ class TestThroughput:
     def loaded_worker(self):
         from app.workers.zipformer import ZipformerWorker
         
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
+        input_q = queue.Queue()
+        output_q = queue.Queue()
         worker = ZipformerWorker(input_q, output_q, "zipformer")
         
         try:
             worker.load_model()
         except FileNotFoundError:
             pytest.skip("Model files not found")
+        worker.warmup()
         
         yield worker
-        input_q.close()
-        output_q.close()
     
     @pytest.mark.slow
     def test_throughput_small_chunks(self, loaded_worker):
@@ -163,7 +156,7 @@ class TestThroughput:
         chunk_size = 1024
         num_chunks = 100
         
-        chunk = np.random.randint(-500, 500, chunk_size, dtype=np.int16).tobytes()
+        chunk = synthetic_pcm(chunk_size * 1000 // 16000, amplitude=500)
         
         start = time.perf_counter()
         for _ in range(num_chunks):
@@ -187,7 +180,7 @@ class TestThroughput:
         chunk_size = 16000  # 1 second
         num_chunks = 10
         
-        chunk = np.random.randint(-500, 500, chunk_size, dtype=np.int16).tobytes()
+        chunk = synthetic_pcm(chunk_size * 1000 // 16000, amplitude=500)
         
         start = time.perf_counter()
         for _ in range(num_chunks):
@@ -220,14 +213,15 @@ class TestMemoryStability:
         
         from app.workers.zipformer import ZipformerWorker
         
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
+        input_q = queue.Queue()
+        output_q = queue.Queue()
         worker = ZipformerWorker(input_q, output_q, "zipformer")
         
         try:
             worker.load_model()
         except FileNotFoundError:
             pytest.skip("Model files not found")
+        worker.warmup()
         
         process = psutil.Process()
         
@@ -235,7 +229,7 @@ class TestMemoryStability:
         initial_mem = process.memory_info().rss / (1024 * 1024)
         
         # Process many chunks
-        chunk = np.random.randint(-500, 500, 4096, dtype=np.int16).tobytes()
+        chunk = synthetic_pcm(256, amplitude=500)
         
         memory_readings = []
         for i in range(100):
@@ -256,25 +250,23 @@ class TestMemoryStability:
         
         # Memory growth should be minimal (under 100MB)
         assert mem_growth < 100, f"Memory leak detected: {mem_growth}MB growth"
-        
-        input_q.close()
-        output_q.close()
     
     @pytest.mark.slow
     def test_queue_memory_cleanup(self):
         """Test that output queue doesn't accumulate indefinitely."""
         from app.workers.zipformer import ZipformerWorker
         
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
+        input_q = queue.Queue()
+        output_q = queue.Queue()
         worker = ZipformerWorker(input_q, output_q, "zipformer")
         
         try:
             worker.load_model()
         except FileNotFoundError:
             pytest.skip("Model files not found")
+        worker.warmup()
         
-        chunk = np.random.randint(-500, 500, 4096, dtype=np.int16).tobytes()
+        chunk = synthetic_pcm(256, amplitude=500)
         
         # Process and drain queue periodically
         for i in range(50):
@@ -295,24 +287,17 @@ class TestMemoryStability:
             final_count += 1
         
         print(f"\n✅ Queue draining works, final items: {final_count}")
-        
-        input_q.close()
-        output_q.close()
 
 
 class TestConcurrency:
     """Test concurrent connection handling."""
     
-    @pytest.fixture
-    def client(self):
-        return TestClient(app)
-    
     @pytest.fixture
     def mock_manager(self):
         with patch("app.api.endpoints.manager") as mock:
             input_q = MagicMock()
             output_q = MagicMock()
-            output_q.empty.return_value = True
+            output_q.get.side_effect = queue.Empty
             mock.get_queues.return_value = (input_q, output_q)
             mock.active_processes = {"zipformer": MagicMock()}
             yield mock
@@ -322,7 +307,7 @@ class TestConcurrency:
         for i in range(5):
             with client.websocket_connect("/ws/transcribe") as ws:
                 ws.send_json({"type": "config", "model": "zipformer"})
-                ws.send_bytes(np.zeros(1000, dtype=np.int16).tobytes())
+                ws.send_bytes(bytes(1000 * 2))
             print(f"   Connection {i + 1} completed")
         
         print("\n✅ Sequential connections handled")
@@ -344,25 +329,24 @@ class TestStressConditions:
     def loaded_worker(self):
         from app.workers.zipformer import ZipformerWorker
         
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
+        input_q = queue.Queue()
+        output_q = queue.Queue()
         worker = ZipformerWorker(input_q, output_q, "zipformer")
         
         try:
             worker.load_model()
         except FileNotFoundError:
             pytest.skip("Model files not found")
+        worker.warmup()
         
         yield worker
-        input_q.close()
-        output_q.close()
     
     @pytest.mark.slow
     def test_burst_processing(self, loaded_worker):
         """Test handling of burst of audio data."""
         # Simulate 5 seconds of audio arriving at once
         total_samples = 16000 * 5
-        audio = np.random.randint(-500, 500, total_samples, dtype=np.int16).tobytes()
+        audio = synthetic_pcm(total_samples * 1000 // 16000, amplitude=500)
         
         start = time.perf_counter()
         loaded_worker.process(audio)
@@ -377,8 +361,8 @@ class TestStressConditions:
     @pytest.mark.slow
     def test_alternating_silence_and_speech(self, loaded_worker):
         """Test performance with alternating silence/speech pattern."""
-        silence = np.zeros(4096, dtype=np.int16).tobytes()
-        speech = np.random.randint(-10000, 10000, 4096, dtype=np.int16).tobytes()
+        silence = bytes(4096 * 2)
+        speech = synthetic_pcm(256, amplitude=10000)
         
         latencies = []
         
@@ -411,7 +395,7 @@ class TestStressConditions:
         start = time.perf_counter()
         
         for _ in range(num_chunks):
-            chunk = np.random.randint(-500, 500, chunk_size, dtype=np.int16).tobytes()
+            chunk = synthetic_pcm(chunk_size * 1000 // 16000, amplitude=500)
             loaded_worker.process(chunk)
         
         loaded_worker.flush()
@@ -438,18 +422,17 @@ class TestEdgeCasePerformance:
     def loaded_worker(self):
         from app.workers.zipformer import ZipformerWorker
         
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
+        input_q = queue.Queue()
+        output_q = queue.Queue()
         worker = ZipformerWorker(input_q, output_q, "zipformer")
         
         try:
             worker.load_model()
         except FileNotFoundError:
             pytest.skip("Model files not found")
+        worker.warmup()
         
         yield worker
-        input_q.close()
-        output_q.close()
     
     @pytest.mark.slow
     def test_maximum_amplitude_audio(self, loaded_worker):
@@ -12,16 +12,39 @@ Run with: pytest tests/comprehensive/test_zipformer_integration.py -v -s
 """
 import pytest
 import numpy as np
-import multiprocessing
-import sys
+import queue
 import os
 import time
 import wave
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
-
 from app.workers.zipformer import ZipformerWorker
-from app.core.config import settings
+from tests.audio_samples import SILENCE_1S, synthetic_pcm
+from tests.model_paths import ZIPFORMER_MODEL_DIR
+
+
+@pytest.fixture(scope="module")
+def zipformer_recognizer():
+    """Load the Zipformer model once and share its recognizer across the module."""
+    worker = ZipformerWorker(None, None, "zipformer")
+    try:
+        worker.load_model()
+    except FileNotFoundError:
+        pytest.skip("Model files not found")
+    worker.warmup()
+    return worker.recognizer
+
+
+@pytest.fixture
+def loaded_worker(zipformer_recognizer):
+    """Zipformer worker on the shared recognizer with its own queues and stream."""
+    input_q = queue.Queue()
+    output_q = queue.Queue()
+    worker = ZipformerWorker(input_q, output_q, "zipformer")
+    worker.recognizer = zipformer_recognizer
+    worker.stream = zipformer_recognizer.create_stream()
+    worker.last_text = ""
+    
+    yield worker
 
 
 class TestZipformerModelLoading:
@@ -29,17 +52,13 @@ class TestZipformerModelLoading:
     
     @pytest.fixture
     def worker_queues(self):
-        """Create multiprocessing queues for worker."""
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
+        """Create in-process queues for worker."""
+        input_q = queue.Queue()
+        output_q = queue.Queue()
         yield input_q, output_q
-        input_q.close()
-        output_q.close()
     
     def test_model_files_exist(self):
         """Verify all required model files are present."""
-        model_path = os.path.join(settings.MODEL_STORAGE_PATH, "zipformer", "hynt-zipformer-30M-6000h")
-        
         required_files = [
             "encoder-epoch-20-avg-10.int8.onnx",
             "decoder-epoch-20-avg-10.int8.onnx",
@@ -48,19 +67,14 @@ class TestZipformerModelLoading:
             "bpe.model",
         ]
         
-        missing_files = []
-        for f in required_files:
-            filepath = os.path.join(model_path, f)
-            if not os.path.exists(filepath):
-                missing_files.append(f)
+        missing_files = [f for f in required_files if not (ZIPFORMER_MODEL_DIR / f).is_file()]
         
         if missing_files:
             pytest.skip(f"Model files not found: {missing_files}")
         
         print("\n✅ All required model files present:")
         for f in required_files:
-            filepath = os.path.join(model_path, f)
-            size_mb = os.path.getsize(filepath) / (1024 * 1024)
+            size_mb = (ZIPFORMER_MODEL_DIR / f).stat().st_size / (1024 * 1024)
             print(f"   - {f}: {size_mb:.2f} MB")
     
     @pytest.mark.slow
@@ -70,9 +84,9 @@ class TestZipformerModelLoading:
         worker = ZipformerWorker(input_q, output_q, "zipformer")
         
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             worker.load_model()
-            load_time = time.time() - start_time
+            load_time = time.perf_counter() - start_time
             
             assert worker.recognizer is not None
             assert worker.stream is not None
@@ -138,27 +152,10 @@ class TestZipformerModelLoading:
 class TestZipformerAudioProcessing:
     """Test audio processing through Zipformer."""
     
-    @pytest.fixture
-    def loaded_worker(self):
-        """Create and load a Zipformer worker."""
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
-        worker = ZipformerWorker(input_q, output_q, "zipformer")
-        
-        try:
-            worker.load_model()
-        except FileNotFoundError:
-            pytest.skip("Model files not found")
-        
-        yield worker
-        input_q.close()
-        output_q.close()
-    
     @pytest.fixture
     def silence_audio(self):
-        """Generate 1 second of silence (Int16 bytes)."""
-        samples = np.zeros(16000, dtype=np.int16)
-        return samples.tobytes()
+        """1 second of silence (Int16 bytes), shared across tests."""
+        return SILENCE_1S
     
     @pytest.fixture
     def noise_audio(self):
@@ -244,7 +241,7 @@ class TestZipformerAudioProcessing:
     def test_process_very_small_chunk(self, loaded_worker):
         """Test processing very small audio chunk."""
         # Just 10 samples
-        small_audio = np.zeros(10, dtype=np.int16).tobytes()
+        small_audio = bytes(10 * 2)
         
         # Should not crash
         loaded_worker.process(small_audio)
@@ -254,22 +251,6 @@ class TestZipformerAudioProcessing:
 class TestZipformerStreamingSimulation:
     """Simulate real-time streaming transcription."""
     
-    @pytest.fixture
-    def loaded_worker(self):
-        """Create and load a Zipformer worker."""
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
-        worker = ZipformerWorker(input_q, output_q, "zipformer")
-        
-        try:
-            worker.load_model()
-        except FileNotFoundError:
-            pytest.skip("Model files not found")
-        
-        yield worker
-        input_q.close()
-        output_q.close()
-    
     @pytest.mark.slow
     def test_streaming_with_realistic_timing(self, loaded_worker):
         """Simulate realistic streaming with chunk timing."""
@@ -285,12 +266,12 @@ class TestZipformerStreamingSimulation:
         latencies = []
         
         for i in range(num_chunks):
-            # Generate chunk with slight variation (simulating real audio)
-            chunk = np.random.randint(-500, 500, chunk_size_samples, dtype=np.int16).tobytes()
+            # Low-amplitude seeded noise (simulating real audio)
+            chunk = synthetic_pcm(int(chunk_duration_ms), amplitude=500)
             
-            start = time.time()
+            start = time.perf_counter()
             loaded_worker.process(chunk)
-            process_time = (time.time() - start) * 1000
+            process_time = (time.perf_counter() - start) * 1000
             latencies.append(process_time)
             
             # Simulate real-time: wait for chunk duration minus processing time
@@ -327,22 +308,6 @@ class TestZipformerStreamingSimulation:
 class TestZipformerResetHandling:
     """Test reset/flush command handling."""
     
-    @pytest.fixture
-    def loaded_worker(self):
-        """Create and load a Zipformer worker."""
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
-        worker = ZipformerWorker(input_q, output_q, "zipformer")
-        
-        try:
-            worker.load_model()
-        except FileNotFoundError:
-            pytest.skip("Model files not found")
-        
-        yield worker
-        input_q.close()
-        output_q.close()
-    
     @pytest.mark.slow
     def test_reset_creates_new_stream(self, loaded_worker):
         """Test that reset creates a fresh stream."""
@@ -400,22 +365,6 @@ class TestZipformerResetHandling:
 class TestZipformerEdgeCases:
     """Test edge cases and error handling."""
     
-    @pytest.fixture
-    def loaded_worker(self):
-        """Create and load a Zipformer worker."""
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
-        worker = ZipformerWorker(input_q, output_q, "zipformer")
-        
-        try:
-            worker.load_model()
-        except FileNotFoundError:
-            pytest.skip("Model files not found")
-        
-        yield worker
-        input_q.close()
-        output_q.close()
-    
     @pytest.mark.slow
     def test_invalid_audio_data(self, loaded_worker):
         """Test handling of invalid audio data."""
@@ -433,11 +382,11 @@ class TestZipformerEdgeCases:
     def test_very_long_audio(self, loaded_worker):
         """Test processing very long audio segment."""
         # 10 seconds of audio
-        long_audio = np.random.randint(-500, 500, 160000, dtype=np.int16).tobytes()
+        long_audio = synthetic_pcm(10000, amplitude=500)
         
-        start = time.time()
+        start = time.perf_counter()
         loaded_worker.process(long_audio)
-        process_time = time.time() - start
+        process_time = time.perf_counter() - start
         
         print(f"\n📊 Long audio (10s) processing:")
         print(f"   Processing time: {process_time:.2f}s")
@@ -449,12 +398,12 @@ class TestZipformerEdgeCases:
     @pytest.mark.slow
     def test_rapid_chunk_succession(self, loaded_worker):
         """Test rapid succession of chunks (stress test)."""
-        chunk = np.random.randint(-100, 100, 1024, dtype=np.int16).tobytes()
+        chunk = synthetic_pcm(64, amplitude=100)
         
-        start = time.time()
+        start = time.perf_counter()
         for _ in range(100):
             loaded_worker.process(chunk)
-        total_time = time.time() - start
+        total_time = time.perf_counter() - start
         
         avg_per_chunk = (total_time / 100) * 1000
         
@@ -469,22 +418,6 @@ class TestZipformerEdgeCases:
 class TestZipformerWithRealAudio:
     """Test with real Vietnamese audio if available."""
     
-    @pytest.fixture
-    def loaded_worker(self):
-        """Create and load a Zipformer worker."""
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
-        worker = ZipformerWorker(input_q, output_q, "zipformer")
-        
-        try:
-            worker.load_model()
-        except FileNotFoundError:
-            pytest.skip("Model files not found")
-        
-        yield worker
-        input_q.close()
-        output_q.close()
-    
     @pytest.fixture
     def sample_audio_path(self):
         """Path to sample Vietnamese audio file."""
@@ -10,22 +10,36 @@ This module provides:
 import os
 import sys
 import pytest
+import pytest_asyncio
 import asyncio
 import multiprocessing
-import numpy as np
+from collections import deque
+from types import SimpleNamespace
 from typing import Tuple
-from unittest.mock import MagicMock
 
-# Ensure backend is in path
-backend_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-if backend_path not in sys.path:
-    sys.path.insert(0, backend_path)
+from tests.audio_samples import SILENCE_1S, synthetic_pcm
+
+# Point the app engine at an in-memory SQLite DB before app.core.database is
+# imported, so lifespan/create_db_and_tables never touch database.db on disk.
+# aiosqlite uses a StaticPool for :memory: URLs, so the schema that
+# `setup_database` creates once stays visible for the whole session; the
+# shared HTTP clients depend on it because they never run lifespan.
+# An explicit DATABASE_URL still wins.
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
 
 
 # =============================================================================
 # Pytest Configuration
 # =============================================================================
 
+def pytest_addoption(parser):
+    """Register command line options."""
+    parser.addoption(
+        "--run-slow", action="store_true", default=False,
+        help="run tests marked slow (skipped by default)",
+    )
+
+
 def pytest_configure(config):
     """Configure pytest markers."""
     config.addinivalue_line(
@@ -37,64 +51,201 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "benchmark: marks tests as performance benchmarks"
     )
+    _install_uvloop_policy()
+
+
+def _install_uvloop_policy():
+    """Run test event loops on uvloop where available.
+    
+    Installed as the global policy so every loop factory picks it up:
+    pytest-asyncio's `event_loop` fixture (0.21) and `event_loop_policy`
+    default (>= 0.23), plus the anyio portal behind the sync TestClient.
+    uvloop ships with uvicorn[standard] on non-Windows platforms; elsewhere
+    the default asyncio policy is kept.
+    """
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+# All async tests and fixtures share one event loop for the session. On
+# pytest-asyncio >= 0.24 that is the asyncio_default_*_loop_scope settings in
+# pyproject.toml; the pinned 0.21 only honours an overridden `event_loop`.
+if tuple(int(part) for part in pytest_asyncio.__version__.split(".")[:2]) < (0, 24):
+    @pytest.fixture(scope="session")
+    def event_loop():
+        """Session-wide event loop for pytest-asyncio < 0.24."""
+        loop = asyncio.get_event_loop_policy().new_event_loop()
+        yield loop
+        loop.close()
 
 
 # =============================================================================
 # Database Fixtures
 # =============================================================================
 
-@pytest.fixture(scope="function")
+# create_db_and_tables is idempotent; run it at most once per test session
+_db_initialized = False
+
+
+@pytest.fixture(scope="session")
 async def setup_database():
     """Setup database for async tests that need it."""
-    from app.core.database import create_db_and_tables
-    await create_db_and_tables()
+    global _db_initialized
+    if not _db_initialized:
+        from app.core.database import create_db_and_tables
+        await create_db_and_tables()
+        _db_initialized = True
     yield
 
 
 @pytest.fixture(scope="function")
 def setup_database_sync():
     """Setup database for sync tests that need it."""
-    import asyncio
-    from app.core.database import create_db_and_tables
-    asyncio.get_event_loop().run_until_complete(create_db_and_tables())
+    global _db_initialized
+    if not _db_initialized:
+        import asyncio
+        from app.core.database import create_db_and_tables
+        asyncio.get_event_loop().run_until_complete(create_db_and_tables())
+        _db_initialized = True
     yield
 
 
+@pytest.fixture(scope="session")
+async def test_db_engine():
+    """In-memory SQLite engine shared by the whole test session.
+    
+    The schema is created once; per-test isolation comes from
+    `test_db_session` rolling back its outer transaction.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import StaticPool
+    from sqlmodel import SQLModel
+    from app.models import schema  # noqa: F401 - registers tables on SQLModel.metadata
+    
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    
+    # The sqlite driver defers BEGIN and breaks SAVEPOINT semantics;
+    # let SQLAlchemy emit BEGIN itself so nested rollbacks work.
+    # Durability is meaningless for a throwaway in-memory DB, so skip it.
+    @event.listens_for(engine.sync_engine, "connect")
+    def configure_connection(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def test_db_session(test_db_engine):
+    """Database session whose writes are rolled back after each test.
+    
+    `session.commit()` inside a test only releases a SAVEPOINT; the outer
+    connection-level transaction is rolled back on teardown.
+    """
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from sqlmodel.ext.asyncio.session import AsyncSession
+    
+    async with test_db_engine.connect() as conn:
+        trans = await conn.begin()
+        maker = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        async with maker() as session:
+            yield session
+        await trans.rollback()
+
+
 # =============================================================================
 # HTTP Client Fixtures
 # =============================================================================
 
-@pytest.fixture
-async def async_client():
-    """Async HTTP client for testing API endpoints."""
-    from httpx import AsyncClient, ASGITransport
+@pytest.fixture(scope="session")
+def asgi_transport(setup_database):
+    """In-process ASGI transport shared by every async client in the session."""
+    from httpx import ASGITransport
     from main import app
     
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test"
-    ) as client:
-        yield client
+    return ASGITransport(app=app)
 
 
 @pytest.fixture
-def sync_client():
-    """Sync HTTP client for testing API endpoints."""
+async def async_client(asgi_transport):
+    """Async HTTP client for testing API endpoints.
+    
+    Only the thin client is per-test (it binds to the running event loop);
+    the app import and transport are built once per session.
+    """
+    from httpx import AsyncClient
+    
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def sync_client(setup_database):
+    """Sync HTTP client for testing API endpoints, shared by the session."""
     from fastapi.testclient import TestClient
     from main import app
     return TestClient(app)
 
 
+@pytest.fixture(scope="session")
+def client(sync_client):
+    """`client` used by the endpoint and WebSocket suites.
+    
+    TestClient only runs lifespan when entered as a context manager, so one
+    instance is safe to share; tests patch the manager per test as needed.
+    """
+    return sync_client
+
+
 # =============================================================================
 # Mock Queue Fixtures
 # =============================================================================
 
+def _deque_queue() -> SimpleNamespace:
+    """In-process stand-in exposing the multiprocessing.Queue calls workers use."""
+    dq = deque()
+    return SimpleNamespace(
+        put=dq.append,
+        put_nowait=dq.append,
+        get=dq.popleft,
+        get_nowait=dq.popleft,
+        empty=lambda: not dq,
+        qsize=dq.__len__,
+        close=lambda: None,
+        items=dq,
+    )
+
+
 @pytest.fixture
-def mock_queues() -> Tuple[MagicMock, MagicMock]:
-    """Mock multiprocessing queues for worker tests."""
-    input_q = MagicMock(spec=multiprocessing.Queue)
-    output_q = MagicMock(spec=multiprocessing.Queue)
-    return input_q, output_q
+def mock_queues() -> Tuple[SimpleNamespace, SimpleNamespace]:
+    """Deque-backed fake queues for worker tests (no spec introspection)."""
+    return _deque_queue(), _deque_queue()
 
 
 @pytest.fixture
@@ -114,29 +265,20 @@ def real_queues() -> Tuple[multiprocessing.Queue, multiprocessing.Queue]:
 
 @pytest.fixture
 def dummy_audio_bytes() -> bytes:
-    """Generate 1 second of dummy audio (16kHz, int16, mono)."""
-    duration_sec = 1.0
-    sample_rate = 16000
-    samples = np.random.randint(-32768, 32767, int(sample_rate * duration_sec), dtype=np.int16)
-    return samples.tobytes()
+    """1 second of seeded noise audio (16kHz, int16, mono)."""
+    return synthetic_pcm(1000, amplitude=32767)
 
 
 @pytest.fixture
 def silence_audio_bytes() -> bytes:
-    """Generate 1 second of silence (16kHz, int16, mono)."""
-    duration_sec = 1.0
-    sample_rate = 16000
-    samples = np.zeros(int(sample_rate * duration_sec), dtype=np.int16)
-    return samples.tobytes()
+    """1 second of silence (16kHz, int16, mono)."""
+    return SILENCE_1S
 
 
 @pytest.fixture
 def long_audio_bytes() -> bytes:
-    """Generate 5 seconds of dummy audio for VAD testing."""
-    duration_sec = 5.0
-    sample_rate = 16000
-    samples = np.random.randint(-32768, 32767, int(sample_rate * duration_sec), dtype=np.int16)
-    return samples.tobytes()
+    """5 seconds of seeded noise audio for VAD testing."""
+    return synthetic_pcm(5000, amplitude=32767)
 
 
 # =============================================================================
@@ -166,7 +308,13 @@ def pytest_collection_modifyitems(config, items):
     sock.close()
     
     skip_e2e = pytest.mark.skip(reason="E2E test requires running backend on localhost:8000")
+    # Slow tests (real model loads, benchmarks) are opt-in; an explicit -m
+    # expression (e.g. `-m slow`) is taken as the selection instead
+    run_slow = config.getoption("--run-slow") or bool(config.getoption("-m"))
+    skip_slow = pytest.mark.skip(reason="slow test, use --run-slow to run")
     
     for item in items:
         if "e2e" in item.keywords and not backend_running:
             item.add_marker(skip_e2e)
+        if "slow" in item.keywords and not run_slow:
+            item.add_marker(skip_slow)
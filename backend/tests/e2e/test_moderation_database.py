@@ -16,6 +16,8 @@ from typing import Any, Optional
 
 import websockets
 
+from tests.ws_frames import ws_events
+
 
 # Test configuration
 BASE_URL = "ws://localhost:8000"
@@ -124,7 +126,7 @@ async def send_text_for_moderation(text: str, session_id: str) -> Optional[dict]
             try:
                 while True:
                     response = await asyncio.wait_for(ws.recv(), timeout=3.0)
-                    responses.append(json.loads(response))
+                    responses.extend(ws_events(response))
             except asyncio.TimeoutError:
                 pass
             
@@ -155,7 +157,7 @@ async def test_moderation_via_http(text: str) -> Optional[dict]:
             return None
 
 
-async def test_database_schema():
+def test_database_schema():
     """Test that the database schema has the new moderation fields."""
     print_test_header("Database Schema Verification")
     
@@ -184,7 +186,7 @@ async def test_database_schema():
         return False
 
 
-async def test_insert_with_moderation():
+def test_insert_with_moderation():
     """Test inserting records with moderation data directly into database."""
     print_test_header("Direct Database Insert Test")
     
@@ -294,12 +296,12 @@ async def test_websocket_flow():
             # Wait for ready message or first response
             try:
                 response = await asyncio.wait_for(ws.recv(), timeout=10.0)
-                resp_data = json.loads(response)
-                print_success(f"Received: type={resp_data.get('type', 'transcription')}")
-                
-                if resp_data.get('type') == 'error':
-                    print_failure(f"Error: {resp_data.get('message')}")
-                    return False
+                for resp_data in ws_events(response):
+                    print_success(f"Received: type={resp_data.get('type', 'transcription')}")
+                    
+                    if resp_data.get('type') == 'error':
+                        print_failure(f"Error: {resp_data.get('message')}")
+                        return False
                     
             except asyncio.TimeoutError:
                 print_info("No immediate response (waiting for audio)")
@@ -313,9 +315,9 @@ async def test_websocket_flow():
             try:
                 while True:
                     response = await asyncio.wait_for(ws.recv(), timeout=3.0)
-                    resp_data = json.loads(response)
-                    responses.append(resp_data)
-                    print_info(f"Response: type={resp_data.get('type', 'transcription')}")
+                    for resp_data in ws_events(response):
+                        responses.append(resp_data)
+                        print_info(f"Response: type={resp_data.get('type', 'transcription')}")
             except asyncio.TimeoutError:
                 pass
             except websockets.exceptions.ConnectionClosed:
@@ -482,29 +484,29 @@ async def test_full_audio_flow():
                     if isinstance(response, bytes):
                         continue
                     
-                    resp_data = json.loads(response)
-                    responses.append(resp_data)
-                    
-                    resp_type = resp_data.get("type", "transcription")
-                    
-                    if resp_type == "transcription" or "text" in resp_data:
-                        text = resp_data.get("text", "")
-                        is_final = resp_data.get("is_final", False)
-                        if is_final and text:
-                            transcription_text = text
-                            print_info(f"Final transcription: {text[:50]}...")
-                    
-                    elif resp_type == "moderation":
-                        moderation_result = resp_data
-                        label = resp_data.get("label", "")
-                        confidence = resp_data.get("confidence", 0)
-                        keywords = resp_data.get("detected_keywords", [])
-                        print_info(f"Moderation: label={label}, confidence={confidence:.2f}")
-                        if keywords:
-                            print_info(f"  Keywords: {keywords}")
-                    
-                    elif resp_type == "session_saved":
-                        print_success(f"Session saved confirmation received")
+                    for resp_data in ws_events(response):
+                        responses.append(resp_data)
+                        
+                        resp_type = resp_data.get("type", "transcription")
+                        
+                        if resp_type == "transcription" or "text" in resp_data:
+                            text = resp_data.get("text", "")
+                            is_final = resp_data.get("is_final", False)
+                            if is_final and text:
+                                transcription_text = text
+                                print_info(f"Final transcription: {text[:50]}...")
+                        
+                        elif resp_type == "moderation":
+                            moderation_result = resp_data
+                            label = resp_data.get("label", "")
+                            confidence = resp_data.get("confidence", 0)
+                            keywords = resp_data.get("detected_keywords", [])
+                            print_info(f"Moderation: label={label}, confidence={confidence:.2f}")
+                            if keywords:
+                                print_info(f"  Keywords: {keywords}")
+                        
+                        elif resp_type == "session_saved":
+                            print_success(f"Session saved confirmation received")
                         
             except asyncio.TimeoutError:
                 pass
@@ -557,11 +559,11 @@ async def main():
     results = []
     
     # Test 1: Database schema
-    results.append(("Database Schema", await test_database_schema()))
+    results.append(("Database Schema", test_database_schema()))
     print()
     
     # Test 2: Direct database insert
-    results.append(("Direct Insert", await test_insert_with_moderation()))
+    results.append(("Direct Insert", test_insert_with_moderation()))
     print()
     
     # Test 3: WebSocket flow
@@ -10,18 +10,15 @@ Mark: @pytest.mark.e2e - skipped if backend not running
 Mark: @pytest.mark.slow - skipped by default, run with -m slow
 """
 import pytest
-import multiprocessing
+import queue
 import os
-import sys
 import wave
 import time
 import json
 import asyncio
 
-# Add backend to sys.path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
-
 from app.workers.zipformer import ZipformerWorker
+from tests.ws_frames import ws_events
 
 
 # =============================================================================
@@ -65,8 +62,8 @@ class TestRealModelLoading:
     @pytest.mark.slow
     def test_zipformer_worker_real_load(self):
         """Test loading the REAL Zipformer model from disk."""
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
+        input_q = queue.Queue()
+        output_q = queue.Queue()
         
         worker = ZipformerWorker(input_q, output_q, "zipformer")
         
@@ -79,9 +76,6 @@ class TestRealModelLoading:
             pytest.skip(f"Zipformer model files not found: {e}")
         except Exception as e:
             pytest.fail(f"Failed to load real Zipformer model: {e}")
-        finally:
-            input_q.close()
-            output_q.close()
 
 
 # =============================================================================
@@ -94,8 +88,8 @@ class TestRealTranscription:
     @pytest.mark.slow
     def test_zipformer_real_transcription(self, sample_audio):
         """Test Zipformer transcribes real audio."""
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
+        input_q = queue.Queue()
+        output_q = queue.Queue()
         
         worker = ZipformerWorker(input_q, output_q, "zipformer")
         
@@ -122,9 +116,6 @@ class TestRealTranscription:
                 
         except FileNotFoundError:
             pytest.skip("Zipformer model files not found")
-        finally:
-            input_q.close()
-            output_q.close()
 
 
 # =============================================================================
@@ -140,7 +131,6 @@ class TestWebSocketE2E:
         return "ws://localhost:8000/ws/transcribe"
     
     @pytest.mark.e2e
-    @pytest.mark.asyncio
     async def test_websocket_connection(self, ws_uri):
         """Test WebSocket connection to running backend."""
         import websockets
@@ -160,9 +150,9 @@ class TestWebSocketE2E:
                 # Wait for response
                 try:
                     response = await asyncio.wait_for(websocket.recv(), timeout=3.0)
-                    data = json.loads(response)
-                    print(f"Received: {data}")
-                    assert "text" in data or "error" in data
+                    for data in ws_events(response):
+                        print(f"Received: {data}")
+                        assert "text" in data or "error" in data
                 except asyncio.TimeoutError:
                     print("No response received (expected for short audio)")
                     
@@ -170,7 +160,6 @@ class TestWebSocketE2E:
             pytest.skip("Backend not running on localhost:8000")
     
     @pytest.mark.e2e
-    @pytest.mark.asyncio
     async def test_websocket_session_management(self, ws_uri):
         """Test session management via WebSocket."""
         import websockets
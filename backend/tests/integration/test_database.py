@@ -0,0 +1,93 @@
+"""
+Integration tests for transcription log persistence.
+
+Uses the session-scoped in-memory engine from conftest; each test runs
+inside a transaction that is rolled back on teardown.
+"""
+import inspect
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.database import async_session_maker, engine, get_session
+from app.models.schema import TranscriptionLog
+
+
+async def _count_logs(session) -> int:
+    result = await session.exec(select(func.count()).select_from(TranscriptionLog))
+    return result.one()
+
+
+class TestTranscriptionLogPersistence:
+    """Test TranscriptionLog round trips through the database."""
+    
+    async def test_save_and_query_log(self, test_db_session):
+        """Test a committed log is readable within the same test."""
+        assert await _count_logs(test_db_session) == 0
+        
+        test_db_session.add(TranscriptionLog(
+            session_id="session-1",
+            model_id="zipformer",
+            content="Xin chào",
+            moderation_label="CLEAN",
+            detected_keywords=[],
+        ))
+        await test_db_session.commit()
+        
+        result = await test_db_session.exec(
+            select(TranscriptionLog).where(TranscriptionLog.session_id == "session-1")
+        )
+        log = result.one()
+        assert log.content == "Xin chào"
+        assert log.moderation_label == "CLEAN"
+    
+    async def test_writes_do_not_leak_between_tests(self, test_db_session):
+        """Test each test starts from an empty table."""
+        assert await _count_logs(test_db_session) == 0
+        
+        test_db_session.add(TranscriptionLog(session_id="session-2", model_id="zipformer", content="Tạm biệt"))
+        await test_db_session.commit()
+        
+        assert await _count_logs(test_db_session) == 1
+    
+    async def test_history_pagination(self, test_db_session):
+        """Test offset/limit pagination over logs inserted in one commit."""
+        test_db_session.add_all([
+            TranscriptionLog(session_id=f"session-{i}", model_id="zipformer", content=f"Câu {i}")
+            for i in range(5)
+        ])
+        await test_db_session.commit()
+        
+        query = select(TranscriptionLog).order_by(TranscriptionLog.id)
+        first_page = (await test_db_session.exec(query.offset(0).limit(2))).all()
+        last_page = (await test_db_session.exec(query.offset(4).limit(2))).all()
+        
+        assert [log.session_id for log in first_page] == ["session-0", "session-1"]
+        assert [log.session_id for log in last_page] == ["session-4"]
+        assert await _count_logs(test_db_session) == 5
+    
+    @pytest.mark.parametrize("column", ["session_id", "model_id", "content"])
+    async def test_missing_required_column_rolls_back(self, test_db_session, column):
+        """Test a NOT NULL violation raises IntegrityError and leaves no row behind."""
+        fields = {"session_id": "session-bad", "model_id": "zipformer", "content": "Câu lỗi"}
+        fields[column] = None
+        test_db_session.add(TranscriptionLog(**fields))
+        
+        with pytest.raises(IntegrityError):
+            await test_db_session.commit()
+        await test_db_session.rollback()
+        
+        assert await _count_logs(test_db_session) == 0
+
+
+class TestSessionDependency:
+    """Test the get_session dependency wiring without opening a connection."""
+    
+    def test_get_session_is_async_generator_on_app_engine(self):
+        """get_session yields sessions from the shared maker bound to the app engine."""
+        assert inspect.isasyncgenfunction(get_session)
+        assert async_session_maker.class_ is AsyncSession
+        assert async_session_maker.kw["bind"] is engine
+        assert async_session_maker.kw["expire_on_commit"] is False
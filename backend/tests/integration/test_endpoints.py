@@ -8,27 +8,78 @@ Tests REST API endpoints:
 - GET /api/v1/history - Get transcription history
 - WebSocket /ws/transcribe - Real-time transcription
 """
-import pytest
-from fastapi.testclient import TestClient
+import asyncio
+import json
+import queue
+import uuid
 from unittest.mock import MagicMock, patch
-import sys
-import os
-
-# Add backend to sys.path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 
 from main import app
 from app.core.manager import manager
+from app.api.endpoints import _audio_item, _drain, _enqueue, _get_result, _stop_drain
+
+
+class _FakeWebSocket:
+    """Minimal async WebSocket stand-in that records sent frames."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, data):
+        self.sent.append(data)
+
+
+class _ASGIWebSocket:
+    """WebSocket client that drives the ASGI app on the test's own loop.
+    
+    Frames go through asyncio queues straight into the app callable, so
+    there is no TestClient portal thread to hop across per message.
+    """
+
+    def __init__(self, app, path):
+        self.scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "server": ("test", 80),
+            "client": ("test", 50000),
+            "root_path": "",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "headers": [],
+            "subprotocols": [],
+        }
+        self.app = app
+        self._to_app = asyncio.Queue()
+        self._from_app = asyncio.Queue()
+        self._task = None
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(
+            self.app(self.scope, self._to_app.get, self._from_app.put)
+        )
+        await self._to_app.put({"type": "websocket.connect"})
+        message = await asyncio.wait_for(self._from_app.get(), timeout=5)
+        assert message["type"] == "websocket.accept"
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._to_app.put({"type": "websocket.disconnect", "code": 1000})
+        await asyncio.wait_for(self._task, timeout=15)
+
+    async def send_json(self, data):
+        await self._to_app.put({"type": "websocket.receive", "text": json.dumps(data)})
+
+    async def receive_json(self):
+        message = await asyncio.wait_for(self._from_app.get(), timeout=5)
+        assert message["type"] == "websocket.send"
+        return json.loads(message["text"])
 
 
 class TestModelsEndpoints:
     """Test /api/v1/models endpoints."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-    
     def test_get_models(self, client):
         """Test listing available models."""
         response = client.get("/api/v1/models")
@@ -54,16 +105,18 @@ class TestModelsEndpoints:
         response = client.get("/api/v1/models")
         assert response.headers["content-type"] == "application/json"
         assert isinstance(response.json(), list)
+    
+    async def test_get_models_async_client(self, async_client):
+        """Test the shared ASGI transport serves requests from the async client."""
+        response = await async_client.get("/api/v1/models")
+        
+        assert response.status_code == 200
+        assert [m["id"] for m in response.json()] == ["zipformer"]
 
 
 class TestSwitchModelEndpoint:
     """Test POST /api/v1/models/switch endpoint."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-    
     @patch("app.core.manager.ModelManager.get_queues")
     @patch("app.core.manager.ModelManager.start_model")
     def test_switch_model_success(self, mock_start_model, mock_get_queues, client):
@@ -120,11 +173,6 @@ class TestSwitchModelEndpoint:
 class TestModelStatusEndpoint:
     """Test GET /api/v1/models/status endpoint."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-    
     def test_get_status_idle(self, client):
         """Test status when no model loaded."""
         # Ensure no model is loaded
@@ -141,6 +189,20 @@ class TestModelStatusEndpoint:
     
     @patch.object(manager, 'current_model', 'zipformer')
     @patch.object(manager, 'active_processes', {'zipformer': MagicMock()})
+    @patch.object(manager, 'ready_events', {'zipformer': MagicMock(**{"is_set.return_value": False})})
+    def test_get_status_loading_until_worker_ready(self, client):
+        """Test a started worker reports loading until its model has loaded."""
+        response = client.get("/api/v1/models/status")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["current_model"] == "zipformer"
+        assert data["is_loaded"] is False
+        assert data["status"] == "loading"
+    
+    @patch.object(manager, 'current_model', 'zipformer')
+    @patch.object(manager, 'active_processes', {'zipformer': MagicMock()})
+    @patch.object(manager, 'ready_events', {'zipformer': MagicMock(**{"is_set.return_value": True})})
     def test_get_status_ready(self, client):
         """Test status when model is loaded."""
         response = client.get("/api/v1/models/status")
@@ -155,13 +217,7 @@ class TestModelStatusEndpoint:
 class TestHistoryEndpoint:
     """Test GET /api/v1/history endpoint."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-    
-    @pytest.mark.asyncio
-    async def test_get_history_empty(self, client):
+    def test_get_history_empty(self, client):
         """Test getting empty history."""
         response = client.get("/api/v1/history")
         
@@ -169,15 +225,13 @@ class TestHistoryEndpoint:
         data = response.json()
         assert isinstance(data, list)
     
-    @pytest.mark.asyncio
-    async def test_get_history_with_pagination(self, client):
+    def test_get_history_with_pagination(self, client):
         """Test history pagination parameters."""
         response = client.get("/api/v1/history?page=1&limit=10")
         
         assert response.status_code == 200
     
-    @pytest.mark.asyncio
-    async def test_get_history_with_filters(self, client):
+    def test_get_history_with_filters(self, client):
         """Test history filter parameters."""
         response = client.get("/api/v1/history?model=zipformer")
         
@@ -187,11 +241,6 @@ class TestHistoryEndpoint:
 class TestHealthEndpoints:
     """Test health check endpoints."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-    
     def test_root_endpoint(self, client):
         """Test root endpoint returns health status."""
         response = client.get("/")
@@ -211,15 +260,27 @@ class TestHealthEndpoints:
         assert "model_loaded" in data
         assert "current_model" in data
 
+    async def test_read_only_routes_wired(self, async_client):
+        """Test every stateless GET route is mounted and responds.
+
+        The routes are independent, so the requests go out concurrently.
+        """
+        paths = [
+            "/",
+            "/health",
+            "/api/v1/models",
+            "/api/v1/models/status",
+            "/api/v1/moderation/status",
+        ]
+        responses = await asyncio.gather(*(async_client.get(path) for path in paths))
+
+        status_by_path = {path: r.status_code for path, r in zip(paths, responses)}
+        assert status_by_path == {path: 200 for path in paths}
+
 
 class TestWebSocketEndpoint:
     """Test WebSocket /ws/transcribe endpoint."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-    
     @patch("app.api.endpoints.manager")
     def test_websocket_connection(self, mock_manager, client):
         """Test WebSocket connection establishment."""
@@ -227,7 +288,7 @@ class TestWebSocketEndpoint:
         input_q = MagicMock()
         input_q.put = MagicMock()
         output_q = MagicMock()
-        output_q.empty.return_value = True
+        output_q.get.side_effect = queue.Empty
         mock_manager.get_queues.return_value = (input_q, output_q)
         
         with client.websocket_connect("/ws/transcribe") as websocket:
@@ -245,15 +306,159 @@ class TestWebSocketEndpoint:
         """Test starting a new session via WebSocket."""
         input_q = MagicMock()
         output_q = MagicMock()
-        output_q.empty.return_value = True
+        output_q.get.side_effect = queue.Empty
         mock_manager.get_queues.return_value = (input_q, output_q)
         
         with client.websocket_connect("/ws/transcribe") as websocket:
             # Send session start
             websocket.send_json({
                 "type": "start_session",
-                "sessionId": "test-session-123"
+                "sessionId": f"test-{uuid.uuid4().hex[:12]}"
             })
             
             # Should have put reset command in queue
             # Note: actual assertion depends on async timing
+    
+    @patch("app.api.endpoints.manager")
+    async def test_websocket_ping_pong(self, mock_manager):
+        """Test pong is delivered through the per-connection send queue."""
+        input_q = MagicMock()
+        output_q = MagicMock()
+        output_q.get.side_effect = queue.Empty
+        mock_manager.get_queues.return_value = (input_q, output_q)
+        
+        async with _ASGIWebSocket(app, "/ws/transcribe") as websocket:
+            await websocket.send_json({"type": "config", "model": "zipformer"})
+            await websocket.send_json({"type": "ping", "timestamp": 1234})
+            
+            data = await websocket.receive_json()
+            assert data == {"type": "pong", "timestamp": 1234}
+    
+    async def test_drain_coalesces_queued_messages(self):
+        """Test messages queued together are sent as one events frame."""
+        websocket = _FakeWebSocket()
+        transcript = {"text": "Xin chào", "is_final": True, "model": "zipformer"}
+        moderation = {"type": "moderation", "label": "CLEAN", "confidence": 1.0}
+        
+        out_q = asyncio.Queue()
+        for message in (transcript, moderation, None):
+            out_q.put_nowait(message)
+        
+        await _drain(websocket, out_q, asyncio.Event())
+        
+        assert len(websocket.sent) == 1
+        payload = json.loads(websocket.sent[0])
+        assert payload == {"events": [transcript, moderation]}
+    
+    async def test_drain_individual_mode_sends_one_frame_per_message(self):
+        """Test stream_mode "individual" disables coalescing."""
+        websocket = _FakeWebSocket()
+        transcript = {"text": "Xin chào", "is_final": True, "model": "zipformer"}
+        moderation = {"type": "moderation", "label": "CLEAN", "confidence": 1.0}
+        
+        out_q = asyncio.Queue()
+        for message in (transcript, moderation, None):
+            out_q.put_nowait(message)
+        
+        await _drain(websocket, out_q, asyncio.Event(), batched=False)
+        
+        assert [json.loads(frame) for frame in websocket.sent] == [transcript, moderation]
+    
+    async def test_drain_drops_only_unserializable_message(self):
+        """Test an event orjson rejects is dropped without closing the stream."""
+        websocket = _FakeWebSocket()
+        bad_pong = {"type": "pong", "timestamp": 2 ** 70}
+        transcript = {"text": "Xin chào", "is_final": True, "model": "zipformer"}
+        moderation = {"type": "moderation", "label": "CLEAN", "confidence": 1.0}
+        
+        out_q = asyncio.Queue()
+        for message in (bad_pong, transcript, moderation, None):
+            out_q.put_nowait(message)
+        ws_closed = asyncio.Event()
+        
+        await _drain(websocket, out_q, ws_closed)
+        
+        assert not ws_closed.is_set()
+        assert [json.loads(frame) for frame in websocket.sent] == [{"events": [transcript, moderation]}]
+    
+    async def test_drain_individual_mode_skips_unserializable_message(self):
+        """Test a lone unserializable message is dropped and later ones still go out."""
+        websocket = _FakeWebSocket()
+        transcript = {"text": "Xin chào", "is_final": True, "model": "zipformer"}
+        
+        out_q = asyncio.Queue()
+        for message in ({"type": "pong", "timestamp": 2 ** 70}, transcript, None):
+            out_q.put_nowait(message)
+        ws_closed = asyncio.Event()
+        
+        await _drain(websocket, out_q, ws_closed, batched=False)
+        
+        assert not ws_closed.is_set()
+        assert [json.loads(frame) for frame in websocket.sent] == [transcript]
+    
+    async def test_stop_drain_flushes_queued_messages(self):
+        """Test stopping the writer sends the sentinel so queued messages still go out."""
+        websocket = _FakeWebSocket()
+        transcript = {"text": "Xin chào", "is_final": True, "model": "zipformer"}
+        out_q = asyncio.Queue(maxsize=2)
+        drain_task = asyncio.create_task(_drain(websocket, out_q, asyncio.Event(), batched=False))
+        out_q.put_nowait(transcript)
+        
+        await _stop_drain(out_q, drain_task)
+        
+        assert drain_task.done()
+        assert [json.loads(frame) for frame in websocket.sent] == [transcript]
+    
+    async def test_stop_drain_cancels_writer_when_queue_full(self):
+        """Test a full queue cancels the writer instead of blocking on the sentinel."""
+        out_q = asyncio.Queue(maxsize=1)
+        out_q.put_nowait({"text": "Xin", "is_final": False})
+        drain_task = asyncio.create_task(asyncio.Event().wait())
+        
+        await asyncio.wait_for(_stop_drain(out_q, drain_task), timeout=1.0)
+        
+        assert drain_task.cancelled()
+    
+    async def test_enqueue_drops_only_partials_when_full(self):
+        """Test a full send queue drops partials but never finals or moderation."""
+        out_q = asyncio.Queue(maxsize=1)
+        await _enqueue(out_q, {"text": "Xin", "is_final": False})
+        
+        await _enqueue(out_q, {"text": "Xin ch", "is_final": False})
+        assert out_q.qsize() == 1
+        
+        final = {"text": "Xin chào", "is_final": True}
+        moderation = {"type": "moderation", "label": "CLEAN"}
+        waiters = [
+            asyncio.create_task(_enqueue(out_q, final)),
+            asyncio.create_task(_enqueue(out_q, moderation)),
+        ]
+        received = []
+        for _ in range(3):
+            received.append(await out_q.get())
+        await asyncio.gather(*waiters)
+        
+        assert received == [{"text": "Xin", "is_final": False}, final, moderation]
+    
+    def test_get_result_blocking_read(self):
+        """Test worker results are read with one blocking get, None on timeout."""
+        q = queue.Queue()
+        assert _get_result(q, timeout=0.01) is None
+        
+        q.put({"text": "Xin chào"})
+        assert _get_result(q, timeout=0.01) == {"text": "Xin chào"}
+    
+    def test_audio_item_prefers_shared_memory_slot(self):
+        """Test audio goes through a ring slot when one is free, raw bytes otherwise."""
+        from app.workers.shared_audio import AudioSlot, SharedAudioRing
+        
+        chunk = bytes(320)
+        assert _audio_item(None, chunk) is chunk
+        
+        ring = SharedAudioRing(n_slots=1, bytes_per_slot=320)
+        try:
+            assert _audio_item(ring, chunk) == AudioSlot(0, 320)
+            assert _audio_item(ring, chunk) is chunk  # ring full
+        finally:
+            ring.close()
+            ring.unlink()
@@ -7,7 +7,7 @@ Tests cover:
 3. Label inference from spans
 """
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from app.core.manager import ModelManager
 
@@ -69,6 +69,21 @@ class TestModelManagerSpanDetector:
         assert input_q is None
         assert output_q is None
     
+    def test_start_span_detector_uses_mp_context(self):
+        """Test span detector process and queues come from the manager's start context."""
+        mgr = ModelManager()
+        assert mgr._mp_ctx.get_start_method() == ModelManager.SPAN_DETECTOR_START_METHOD
+        
+        mgr._mp_ctx = Mock()
+        with patch.object(mgr, "_get_span_detector_class") as mock_get_class:
+            mgr.start_span_detector("visobert-hsd-span")
+        
+        assert mgr._mp_ctx.Queue.call_count == 2
+        worker = mock_get_class.return_value.return_value
+        mgr._mp_ctx.Process.assert_called_once_with(target=worker.run, daemon=True)
+        mgr._mp_ctx.Process.return_value.start.assert_called_once()
+        assert mgr.current_span_detector == "visobert-hsd-span"
+    
     def test_stop_span_detector_when_not_running(self):
         """Test stopping span detector when none is running doesn't raise error."""
         mgr = ModelManager()
@@ -107,34 +122,66 @@ class TestModelManagerSpanDetector:
         
         mgr.stop_all_models()
         
-        # Verify span detector was stopped
+        # Verify span detector was stopped with a bounded join
         assert mgr.current_span_detector is None
+        mock_process.join.assert_called_with(timeout=2.0)
+        mock_process.terminate.assert_not_called()
+    
+    def test_stop_all_models_terminates_stuck_span_detector(self):
+        """Test that a detector ignoring STOP is terminated after the join timeout."""
+        mgr = ModelManager()
+        mgr.current_span_detector = "visobert-hsd-span"
+        
+        mock_process = Mock()
+        mock_process.is_alive.side_effect = [True, False]
+        mgr.span_detector_process = mock_process
+        
+        mgr.stop_all_models()
+        
+        mock_process.terminate.assert_called_once()
+        mock_process.join.assert_called_with(timeout=0.5)
+        mock_process.kill.assert_not_called()
+        assert mgr.current_span_detector is None
+    
+    async def test_astop_all_models_runs_in_thread(self):
+        """Test that astop_all_models offloads the blocking stop to a thread."""
+        mgr = ModelManager()
+        
+        with patch("app.core.manager.asyncio.to_thread", new_callable=AsyncMock) as mock_to_thread:
+            await mgr.astop_all_models()
+        
+        mock_to_thread.assert_awaited_once_with(mgr.stop_all_models)
 
 
 class TestModerationEndpoints:
     """Tests for moderation REST API endpoints."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        from fastapi.testclient import TestClient
-        from main import app
-        return TestClient(app)
+    @pytest.fixture(scope="class")
+    def status_response(self, client):
+        """Single GET /api/v1/moderation/status shared by the status checks."""
+        return client.get("/api/v1/moderation/status")
     
-    def test_get_moderation_status(self, client):
+    @pytest.mark.parametrize("check", ["keys", "config_keys", "types"])
+    def test_get_moderation_status(self, status_response, check):
         """Test GET /api/v1/moderation/status returns expected fields."""
-        response = client.get("/api/v1/moderation/status")
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert "enabled" in data
-        assert "span_detector_active" in data
-        assert "config" in data
-        
-        config = data["config"]
-        assert "default_enabled" in config
-        assert "confidence_threshold" in config
-        assert "on_final_only" in config
+        assert status_response.status_code == 200
+        data = status_response.json()
+        
+        if check == "keys":
+            assert "enabled" in data
+            assert "span_detector_active" in data
+            assert "config" in data
+        elif check == "config_keys":
+            config = data["config"]
+            assert "default_enabled" in config
+            assert "confidence_threshold" in config
+            assert "on_final_only" in config
+        else:
+            assert isinstance(data["enabled"], bool)
+            assert isinstance(data["span_detector_active"], bool)
+            assert isinstance(data["config"]["default_enabled"], bool)
+            assert isinstance(data["config"]["confidence_threshold"], float)
+            assert isinstance(data["config"]["on_final_only"], bool)
     
     @patch('app.api.endpoints.manager')
     def test_toggle_moderation_enable(self, mock_manager, client):
@@ -169,28 +216,24 @@ class TestLabelInferenceIntegration:
     def test_span_detector_worker_creation(self):
         """Test that SpanDetectorWorker can be created."""
         from app.workers.span_detector import SpanDetectorWorker
-        import multiprocessing
+        import queue
         
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
+        input_q = queue.Queue()
+        output_q = queue.Queue()
         
         worker = SpanDetectorWorker(input_q, output_q, "visobert-hsd-span")
         
         assert worker.model_name == "visobert-hsd-span"
         assert worker.input_queue == input_q
         assert worker.output_queue == output_q
-        
-        # Cleanup
-        input_q.close()
-        output_q.close()
     
     def test_infer_label_returns_correct_structure(self):
         """Test that _infer_label returns (label, label_id, confidence)."""
         from app.workers.span_detector import SpanDetectorWorker
-        import multiprocessing
+        import queue
         
-        input_q = multiprocessing.Queue()
-        output_q = multiprocessing.Queue()
+        input_q = queue.Queue()
+        output_q = queue.Queue()
         
         worker = SpanDetectorWorker(input_q, output_q, "visobert-hsd-span")
         
@@ -206,7 +249,3 @@ class TestLabelInferenceIntegration:
         assert label == "HATE"
         assert label_id == 2
         assert confidence >= 0.85
-        
-        # Cleanup
-        input_q.close()
-        output_q.close()
@@ -22,6 +22,7 @@ Note:
     The model may not detect all offensive spans accurately.
 """
 import pytest
+import statistics
 import time
 import os
 import sys
@@ -31,6 +32,7 @@ from dataclasses import dataclass
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 
+from tests.model_paths import SPAN_DETECTOR_INT8_DIR
 
 @dataclass
 class SpanTestCase:
@@ -57,21 +59,13 @@ class TestSpanDetectorModelIntegration:
         worker = SpanDetectorWorker(input_q, output_q, "visobert-hsd-span")
         
         # Check if model exists
-        from app.core.config import settings
-        model_path = os.path.join(
-            os.path.dirname(__file__), 
-            "../..", 
-            settings.MODEL_STORAGE_PATH, 
-            "visobert-hsd-span", 
-            "onnx-int8"
-        )
-        
-        if not os.path.exists(model_path):
+        if not SPAN_DETECTOR_INT8_DIR.is_dir():
             pytest.skip(
                 "Model not found. Run 'python scripts/setup_hsd_span_model.py' first."
             )
         
         worker.load_model()
+        worker.warmup()
         return worker
     
     def _detect_spans(self, worker, text: str) -> Dict:
@@ -147,7 +141,7 @@ class TestHateSpeechSpanDetection(TestSpanDetectorModelIntegration):
     
     # ==================== Clean Text Tests ====================
     
-    @pytest.mark.parametrize("text,description", [
+    CLEAN_TEXTS = [
         ("Xin chào bạn", "Greeting"),
         ("Hôm nay thời tiết đẹp quá", "Weather comment"),
         ("Tôi đi học mỗi ngày", "Daily activity"),
@@ -156,10 +150,18 @@ class TestHateSpeechSpanDetection(TestSpanDetectorModelIntegration):
         ("Việt Nam là đất nước xinh đẹp", "Country praise"),
         ("Tôi thích ăn phở", "Food preference"),
         ("Học tiếng Anh rất quan trọng", "Education"),
-    ])
-    def test_clean_text_no_spans(self, worker, text, description):
+    ]
+    
+    @pytest.fixture(scope="class")
+    def clean_results(self, worker):
+        """Moderate every clean sample in one batched forward pass."""
+        texts = [text for text, _ in self.CLEAN_TEXTS]
+        return dict(zip(texts, worker.moderate_batch(texts)))
+    
+    @pytest.mark.parametrize("text,description", CLEAN_TEXTS)
+    def test_clean_text_no_spans(self, clean_results, text, description):
         """Test that clean text ideally returns no/minimal spans."""
-        result = self._detect_spans(worker, text)
+        result = clean_results[text]
         
         keywords = result.get("detected_keywords", [])
         print(f"\n[{description}] detected={len(keywords)}")
@@ -377,31 +379,29 @@ class TestPerformance(TestSpanDetectorModelIntegration):
     """Test model performance metrics."""
     
     def test_inference_latency(self, worker):
-        """Test inference latency for typical text."""
+        """Test steady-state inference latency for typical text."""
         text = "Thang ngu nay sao ma cham qua"  # ASCII-safe
+        runs, warmup_runs = 20, 3
         
-        # Warm up
-        worker._detect_spans(text, "warmup")
-        
-        # Measure latency
-        latencies = []
-        for i in range(10):
-            start = time.perf_counter()
+        samples_ns = []
+        for i in range(runs):
+            start = time.perf_counter_ns()
             worker._detect_spans(text, f"test-{i}")
-            latency = (time.perf_counter() - start) * 1000
-            latencies.append(latency)
+            samples_ns.append(time.perf_counter_ns() - start)
         
-        avg_latency = sum(latencies) / len(latencies)
-        min_latency = min(latencies)
-        max_latency = max(latencies)
+        # Discard warmup samples; assert on percentiles, not a single mean
+        steady_ms = [ns / 1e6 for ns in samples_ns[warmup_runs:]]
+        median_ms = statistics.median(steady_ms)
+        p95_ms = statistics.quantiles(steady_ms, n=20)[-1]
         
-        print(f"\nLatency stats (10 runs):")
-        print(f"  Average: {avg_latency:.2f} ms")
-        print(f"  Min: {min_latency:.2f} ms")
-        print(f"  Max: {max_latency:.2f} ms")
+        print(f"\nLatency stats ({len(steady_ms)} steady-state runs):")
+        print(f"  Median: {median_ms:.2f} ms")
+        print(f"  P95: {p95_ms:.2f} ms")
+        print(f"  Min: {min(steady_ms):.2f} ms")
+        print(f"  Max: {max(steady_ms):.2f} ms")
         
-        # Assert reasonable latency (adjust threshold as needed)
-        assert avg_latency < 500, f"Average latency {avg_latency:.2f}ms exceeds 500ms threshold"
+        assert median_ms < 250, f"Median latency {median_ms:.2f}ms exceeds 250ms threshold"
+        assert p95_ms < 500, f"P95 latency {p95_ms:.2f}ms exceeds 500ms threshold"
     
     def test_batch_throughput(self, worker):
         """Test throughput for batch processing."""
@@ -0,0 +1,15 @@
+"""
+Model directories used by model-backed tests.
+
+Resolved once, relative to the backend root rather than the working
+directory; monkeypatch these to point CI at a different model store.
+"""
+from pathlib import Path
+
+from app.core.config import settings
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+MODELS_ROOT = BACKEND_ROOT / settings.MODEL_STORAGE_PATH
+
+ZIPFORMER_MODEL_DIR = MODELS_ROOT / "zipformer" / "hynt-zipformer-30M-6000h"
+SPAN_DETECTOR_INT8_DIR = MODELS_ROOT / "visobert-hsd-span" / "onnx-int8"
@@ -1,4 +1,7 @@
 """Unit tests for AudioData value object."""
+import re
+
+import numpy as np
 import pytest
 from app.domain.value_objects.audio_data import AudioData
 
@@ -44,22 +47,13 @@ class TestAudioDataValueObject:
                 format="pcm",
             )
     
-    def test_validation_negative_sample_rate(self):
-        """Test validation rejects negative sample rate."""
+    @pytest.mark.parametrize("sample_rate", [0, -1, -16000])
+    def test_validation_non_positive_sample_rate(self, sample_rate):
+        """Test validation rejects zero and negative sample rates."""
         with pytest.raises(ValueError, match="must be positive"):
             AudioData(
                 data=b"test",
-                sample_rate=-16000,
-                channels=1,
-                format="pcm",
-            )
-    
-    def test_validation_zero_sample_rate(self):
-        """Test validation rejects zero sample rate."""
-        with pytest.raises(ValueError, match="must be positive"):
-            AudioData(
-                data=b"test",
-                sample_rate=0,
+                sample_rate=sample_rate,
                 channels=1,
                 format="pcm",
             )
@@ -84,6 +78,13 @@ class TestAudioDataValueObject:
                 format="xyz",
             )
     
+    def test_unsupported_format_message_lists_formats_in_order(self):
+        """Test the error lists the shared, immutable format tuple."""
+        assert isinstance(AudioData.SUPPORTED_FORMATS, tuple)
+    
+        with pytest.raises(ValueError, match=re.escape("('pcm', 'wav', 'mp3', 'flac', 'ogg')")):
+            AudioData(data=b"test", sample_rate=16000, channels=1, format="xyz")
+    
     def test_validation_negative_duration(self):
         """Test validation rejects negative duration."""
         with pytest.raises(ValueError, match="must be non-negative"):
@@ -153,7 +154,7 @@ class TestAudioDataValueObject:
     
     def test_get_size_kb(self):
         """Test get_size_kb() returns correct kilobyte count."""
-        data = b"x" * 2048  # 2 KB
+        data = bytes(2048)  # 2 KB
         audio = AudioData(
             data=data,
             sample_rate=16000,
@@ -291,6 +292,13 @@ class TestAudioDataValueObject:
         with pytest.raises(AttributeError):
             audio.sample_rate = 44100  # type: ignore
     
+    def test_slotted_instance(self):
+        """Test instances carry no per-object __dict__."""
+        audio = AudioData.create_pcm_mono(data=b"test")
+    
+        assert not hasattr(audio, "__dict__")
+        assert AudioData.__slots__ == ("data", "sample_rate", "channels", "format", "duration_ms")
+    
     def test_supported_formats(self):
         """Test all supported audio formats."""
         formats = ["pcm", "wav", "mp3", "flac", "ogg"]
@@ -340,3 +348,21 @@ class TestAudioDataValueObject:
         
         assert audio1 == audio2
         assert audio1 != audio3
+    
+    def test_pcm_is_zero_copy_int16_view(self):
+        """Test pcm exposes the raw bytes as int16 without copying."""
+        samples = np.array([0, 16384, -32768, 32767], dtype=np.int16)
+        audio = AudioData.create_pcm_mono(data=samples.tobytes())
+        
+        pcm = audio.pcm
+        
+        assert pcm.dtype == np.int16
+        assert not pcm.flags.owndata
+        assert pcm.tolist() == samples.tolist()
+    
+    def test_pcm_rejects_encoded_formats(self):
+        """Test pcm view is only available for raw PCM audio."""
+        audio = AudioData.from_wav(data=b"RIFF", sample_rate=16000, channels=1)
+        
+        with pytest.raises(ValueError, match="pcm"):
+            audio.pcm
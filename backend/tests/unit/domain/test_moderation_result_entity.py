@@ -5,6 +5,8 @@ from datetime import datetime, timezone
 from app.domain.entities.moderation_result import ModerationResult
 from app.domain.value_objects.confidence_score import ConfidenceScore
 
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 class TestModerationResultEntity:
     """Test suite for ModerationResult entity."""
@@ -174,7 +176,7 @@ class TestModerationResultEntity:
             is_flagged=True,
             detected_keywords=["bad"],
             spans=[],
-            processed_at=datetime.now(timezone.utc),
+            processed_at=_FIXED_NOW,
             model_version="visobert-hsd-span-v2",
         )
         
@@ -182,7 +184,7 @@ class TestModerationResultEntity:
     
     def test_moderation_result_equality(self):
         """Test moderation result equality based on all fields."""
-        processed_at = datetime.now(timezone.utc)
+        processed_at = _FIXED_NOW
         keywords = ["test"]
         
         r1 = ModerationResult(
@@ -255,5 +257,5 @@ class TestModerationResultEntity:
                 is_flagged=False,
                 detected_keywords=[],
                 spans=[],
-                processed_at=datetime.now(timezone.utc),
+                processed_at=_FIXED_NOW,
             )
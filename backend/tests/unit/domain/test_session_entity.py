@@ -5,6 +5,10 @@ from uuid import uuid4
 
 from app.domain.entities.session import Session
 
+# Fixed timestamp well in the past: sessions built from it are already expired
+_FIXED_PAST = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_FIXED_PAST_EXPIRY = _FIXED_PAST + timedelta(hours=1)
+
 
 class TestSessionEntity:
     """Test suite for Session entity."""
@@ -39,15 +43,13 @@ class TestSessionEntity:
     
     def test_is_expired_returns_true_for_expired_session(self):
         """Test is_expired() returns True for expired session."""
-        past_time = datetime.now(timezone.utc) - timedelta(hours=2)
-        
         session = Session(
             id=str(uuid4()),
             model_id="zipformer",
             is_active=True,
             transcription_count=0,
-            created_at=past_time,
-            expires_at=past_time + timedelta(hours=1),  # Expired 1 hour ago
+            created_at=_FIXED_PAST,
+            expires_at=_FIXED_PAST_EXPIRY,
         )
         
         assert session.is_expired() is True
@@ -75,15 +77,13 @@ class TestSessionEntity:
     
     def test_is_valid_returns_false_for_expired_session(self):
         """Test is_valid() returns False for expired session."""
-        past_time = datetime.now(timezone.utc) - timedelta(hours=2)
-        
         session = Session(
             id=str(uuid4()),
             model_id="zipformer",
             is_active=True,
             transcription_count=0,
-            created_at=past_time,
-            expires_at=past_time + timedelta(hours=1),
+            created_at=_FIXED_PAST,
+            expires_at=_FIXED_PAST_EXPIRY,
         )
         
         assert session.is_valid() is False
@@ -153,15 +153,13 @@ class TestSessionEntity:
     
     def test_get_remaining_time_returns_zero_for_expired_session(self):
         """Test get_remaining_time() returns zero timedelta for expired session."""
-        past_time = datetime.now(timezone.utc) - timedelta(hours=2)
-        
         session = Session(
             id=str(uuid4()),
             model_id="zipformer",
             is_active=True,
             transcription_count=0,
-            created_at=past_time,
-            expires_at=past_time + timedelta(hours=1),
+            created_at=_FIXED_PAST,
+            expires_at=_FIXED_PAST_EXPIRY,
         )
         
         remaining = session.get_remaining_time()
@@ -172,8 +170,8 @@ class TestSessionEntity:
     def test_session_identity_by_id(self):
         """Test that sessions with same ID but different fields are different instances."""
         session_id = str(uuid4())
-        created_at = datetime.now(timezone.utc)
-        expires_at = created_at + timedelta(hours=1)
+        created_at = _FIXED_PAST
+        expires_at = _FIXED_PAST_EXPIRY
         
         s1 = Session(
             id=session_id,
@@ -6,6 +6,29 @@ from uuid import uuid4
 from app.domain.entities.transcription import Transcription
 
 
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_SESSION_ID = str(uuid4())
+
+
+def _make_tx(content="text", *, id=1, latency_ms=100.0, **fields):
+    """Build a Transcription, filling in the fields these tests never vary."""
+    return Transcription(
+        id=id,
+        session_id=_SESSION_ID,
+        model_id="zipformer",
+        content=content,
+        latency_ms=latency_ms,
+        created_at=_FIXED_NOW,
+        **fields,
+    )
+
+
+# Read-only instances shared by tests that only query entity state
+_CLEAN = _make_tx("xin chào", id=1, moderation_label="CLEAN", moderation_confidence=0.99)
+_OFFENSIVE = _make_tx("offensive content", id=2, moderation_label="OFFENSIVE", moderation_confidence=0.85)
+_HATE = _make_tx("hate speech", id=3, moderation_label="HATE", moderation_confidence=0.95)
+
+
 class TestTranscriptionEntity:
     """Test suite for Transcription entity."""
     
@@ -34,172 +57,49 @@ class TestTranscriptionEntity:
     
     def test_is_offensive_returns_true_for_offensive_content(self):
         """Test is_offensive() returns True for OFFENSIVE or HATE labels."""
-        offensive_transcription = Transcription(
-            id=1,
-            session_id=str(uuid4()),
-            model_id="zipformer",
-            content="offensive content",
-            latency_ms=100.0,
-            moderation_label="OFFENSIVE",
-            moderation_confidence=0.85,
-            created_at=datetime.now(timezone.utc),
-        )
-        
-        assert offensive_transcription.is_offensive() is True
-        
-        hate_transcription = Transcription(
-            id=2,
-            session_id=str(uuid4()),
-            model_id="zipformer",
-            content="hate speech",
-            latency_ms=100.0,
-            moderation_label="HATE",
-            moderation_confidence=0.92,
-            created_at=datetime.now(timezone.utc),
-        )
-        
-        assert hate_transcription.is_offensive() is True
+        assert _OFFENSIVE.is_offensive() is True
+        assert _HATE.is_offensive() is True
     
     def test_is_offensive_returns_false_for_clean_content(self):
         """Test is_offensive() returns False for CLEAN label."""
-        clean_transcription = Transcription(
-            id=1,
-            session_id=str(uuid4()),
-            model_id="zipformer",
-            content="xin chào",
-            latency_ms=100.0,
-            moderation_label="CLEAN",
-            moderation_confidence=0.99,
-            created_at=datetime.now(timezone.utc),
-        )
-        
-        assert clean_transcription.is_offensive() is False
+        assert _CLEAN.is_offensive() is False
     
     def test_is_clean_returns_true_for_clean_content(self):
         """Test is_clean() returns True for CLEAN label."""
-        clean_transcription = Transcription(
-            id=1,
-            session_id=str(uuid4()),
-            model_id="zipformer",
-            content="xin chào",
-            latency_ms=100.0,
-            moderation_label="CLEAN",
-            created_at=datetime.now(timezone.utc),
-        )
-        
-        assert clean_transcription.is_clean() is True
+        assert _CLEAN.is_clean() is True
     
     def test_is_clean_returns_false_for_offensive_content(self):
         """Test is_clean() returns False for non-CLEAN labels."""
-        offensive_transcription = Transcription(
-            id=1,
-            session_id=str(uuid4()),
-            model_id="zipformer",
-            content="offensive",
-            latency_ms=100.0,
-            moderation_label="OFFENSIVE",
-            created_at=datetime.now(timezone.utc),
-        )
-        
-        assert offensive_transcription.is_clean() is False
+        assert _OFFENSIVE.is_clean() is False
     
     def test_has_high_confidence_moderation(self):
         """Test high confidence moderation detection."""
-        high_conf_transcription = Transcription(
-            id=1,
-            session_id=str(uuid4()),
-            model_id="zipformer",
-            content="text",
-            latency_ms=100.0,
-            moderation_label="OFFENSIVE",
-            moderation_confidence=0.85,
-            created_at=datetime.now(timezone.utc),
-        )
-        
-        assert high_conf_transcription.has_high_confidence_moderation(threshold=0.8) is True
-        assert high_conf_transcription.has_high_confidence_moderation(threshold=0.9) is False
+        assert _OFFENSIVE.has_high_confidence_moderation(threshold=0.8) is True
+        assert _OFFENSIVE.has_high_confidence_moderation(threshold=0.9) is False
     
     def test_has_high_confidence_moderation_with_none(self):
         """Test high confidence moderation when confidence is None."""
-        transcription = Transcription(
-            id=1,
-            session_id=str(uuid4()),
-            model_id="zipformer",
-            content="text",
-            latency_ms=100.0,
-            moderation_label="CLEAN",
-            moderation_confidence=None,
-            created_at=datetime.now(timezone.utc),
-        )
+        transcription = _make_tx(moderation_label="CLEAN", moderation_confidence=None)
         
         assert transcription.has_high_confidence_moderation(threshold=0.8) is False
     
     def test_get_severity_level_hate(self):
         """Test severity level for HATE content."""
-        hate_transcription = Transcription(
-            id=1,
-            session_id=str(uuid4()),
-            model_id="zipformer",
-            content="hate speech",
-            latency_ms=100.0,
-            moderation_label="HATE",
-            moderation_confidence=0.95,
-            created_at=datetime.now(timezone.utc),
-        )
-        
-        assert hate_transcription.get_severity_level() == "HIGH"
+        assert _HATE.get_severity_level() == "HIGH"
     
     def test_get_severity_level_offensive(self):
         """Test severity level for OFFENSIVE content."""
-        offensive_transcription = Transcription(
-            id=1,
-            session_id=str(uuid4()),
-            model_id="zipformer",
-            content="offensive",
-            latency_ms=100.0,
-            moderation_label="OFFENSIVE",
-            moderation_confidence=0.85,
-            created_at=datetime.now(timezone.utc),
-        )
-        
-        assert offensive_transcription.get_severity_level() == "LOW"
+        assert _OFFENSIVE.get_severity_level() == "LOW"
     
     def test_get_severity_level_clean(self):
         """Test severity level for CLEAN content."""
-        clean_transcription = Transcription(
-            id=1,
-            session_id=str(uuid4()),
-            model_id="zipformer",
-            content="xin chào",
-            latency_ms=100.0,
-            moderation_label="CLEAN",
-            created_at=datetime.now(timezone.utc),
-        )
-        
-        assert clean_transcription.get_severity_level() == "NONE"
+        assert _CLEAN.get_severity_level() == "NONE"
     
     def test_transcription_identity_by_id(self):
         """Test that transcriptions with same ID but different fields are different instances."""
-        session_id = str(uuid4())
-        created_at = datetime.now(timezone.utc)
-        
-        t1 = Transcription(
-            id=1,
-            session_id=session_id,
-            model_id="zipformer",
-            content="text",
-            latency_ms=100.0,
-            created_at=created_at,
-        )
+        t1 = _make_tx()
         
-        t2 = Transcription(
-            id=1,
-            session_id=session_id,
-            model_id="zipformer",
-            content="different text",  # Different field
-            latency_ms=200.0,
-            created_at=created_at,
-        )
+        t2 = _make_tx("different text", latency_ms=200.0)  # Different fields
         
         # Dataclasses compare all fields by default, so these are not equal
         assert t1 != t2
@@ -209,13 +109,7 @@ class TestTranscriptionEntity:
     
     def test_transcription_with_optional_fields(self):
         """Test transcription creation with optional fields."""
-        transcription = Transcription(
-            id=1,
-            session_id=str(uuid4()),
-            model_id="zipformer",
-            content="text",
-            latency_ms=100.0,
-            created_at=datetime.now(timezone.utc),
+        transcription = _make_tx(
             moderation_label="OFFENSIVE",
             moderation_confidence=0.95,
             is_flagged=True,
@@ -230,34 +124,18 @@ class TestTranscriptionEntity:
     def test_transcription_moderation_confidence_validation(self):
         """Test that moderation_confidence must be between 0.0 and 1.0."""
         with pytest.raises(ValueError, match="moderation_confidence must be between 0.0 and 1.0"):
-            Transcription(
-                id=1,
-                session_id=str(uuid4()),
-                model_id="zipformer",
-                content="text",
-                latency_ms=100.0,
-                created_at=datetime.now(timezone.utc),
-                moderation_confidence=1.5,  # Invalid: > 1.0
-            )
+            _make_tx(moderation_confidence=1.5)  # Invalid: > 1.0
     
     def test_transcription_is_flagged_offensive(self):
         """Test is_offensive() returns True when is_flagged is True."""
-        flagged_transcription = Transcription(
-            id=1,
-            session_id=str(uuid4()),
-            model_id="zipformer",
-            content="flagged content",
-            latency_ms=100.0,
-            created_at=datetime.now(timezone.utc),
-            is_flagged=True,
-        )
+        flagged_transcription = _make_tx("flagged content", is_flagged=True)
         
         assert flagged_transcription.is_offensive() is True
     
     def test_transcription_to_dict(self):
         """Test to_dict() method returns correct dictionary."""
         transcription = Transcription.create_new(
-            session_id=str(uuid4()),
+            session_id=_SESSION_ID,
             model_id="zipformer",
             content="test content",
             latency_ms=150.0,
@@ -275,29 +153,12 @@ class TestTranscriptionEntity:
     
     def test_get_severity_level_offensive_high_confidence(self):
         """Test severity level for OFFENSIVE content with high confidence (>0.9)."""
-        offensive_transcription = Transcription(
-            id=1,
-            session_id=str(uuid4()),
-            model_id="zipformer",
-            content="offensive",
-            latency_ms=100.0,
-            moderation_label="OFFENSIVE",
-            moderation_confidence=0.95,
-            created_at=datetime.now(timezone.utc),
-        )
+        offensive_transcription = _make_tx("offensive", moderation_label="OFFENSIVE", moderation_confidence=0.95)
         
         assert offensive_transcription.get_severity_level() == "MEDIUM"
     
     def test_get_severity_level_flagged_no_label(self):
         """Test severity level for flagged content without label."""
-        flagged_transcription = Transcription(
-            id=1,
-            session_id=str(uuid4()),
-            model_id="zipformer",
-            content="flagged",
-            latency_ms=100.0,
-            created_at=datetime.now(timezone.utc),
-            is_flagged=True,
-        )
+        flagged_transcription = _make_tx("flagged", is_flagged=True)
         
         assert flagged_transcription.get_severity_level() == "LOW"
@@ -6,16 +6,15 @@ Tests the manager's ability to:
 - Handle valid/invalid model names
 - Manage queues and process lifecycle
 """
+import multiprocessing
 import pytest
 from unittest.mock import MagicMock, patch
-import sys
-import os
-
-# Add backend to sys.path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 
 from app.core.manager import ModelManager, manager
 
+# Workers are created through the manager's multiprocessing context
+_MP_CONTEXT_TYPE = type(multiprocessing.get_context(ModelManager.SPAN_DETECTOR_START_METHOD))
+
 
 class TestModelManager:
     """Test suite for ModelManager class."""
@@ -23,7 +22,12 @@ class TestModelManager:
     @pytest.fixture
     def fresh_manager(self):
         """Create a fresh manager instance for each test."""
-        return ModelManager()
+        manager = ModelManager()
+        yield manager
+        # Started (mocked) models still own real shared-memory audio rings
+        for ring in manager.audio_rings.values():
+            ring.close()
+            ring.unlink()
     
     def test_valid_models_constant(self, fresh_manager):
         """Test that VALID_MODELS contains expected models."""
@@ -37,7 +41,8 @@ class TestModelManager:
         assert fresh_manager.output_queues == {}
         assert fresh_manager.current_model is None
     
-    @patch("app.core.manager.multiprocessing.Process")
+    @pytest.mark.xdist_group("mgr_proc")
+    @patch.object(_MP_CONTEXT_TYPE, "Process")
     @patch("app.core.manager.ModelManager._get_worker_class")
     def test_start_model_zipformer(self, mock_get_worker, mock_process_cls, fresh_manager):
         """Test starting Zipformer model worker."""
@@ -74,33 +79,31 @@ class TestModelManager:
     
     def test_start_invalid_model(self, fresh_manager):
         """Test that invalid model name raises ValueError."""
-        with pytest.raises(ValueError) as excinfo:
+        with pytest.raises(ValueError, match="Unknown model"):
             fresh_manager.start_model("invalid-model")
-        assert "Unknown model" in str(excinfo.value)
 
     def test_start_whisper_model_invalid(self, fresh_manager):
         """Test that faster-whisper model is no longer valid."""
-        with pytest.raises(ValueError) as excinfo:
+        with pytest.raises(ValueError, match="Unknown model"):
             fresh_manager.start_model("faster-whisper")
-        assert "Unknown model" in str(excinfo.value)
 
     def test_start_hkab_model_invalid(self, fresh_manager):
         """Test that hkab model is no longer valid."""
-        with pytest.raises(ValueError) as excinfo:
+        with pytest.raises(ValueError, match="Unknown model"):
             fresh_manager.start_model("hkab")
-        assert "Unknown model" in str(excinfo.value)
     
-    @patch("app.core.manager.multiprocessing.Process")
+    @pytest.mark.xdist_group("mgr_proc")
+    @patch.object(_MP_CONTEXT_TYPE, "Process")
     @patch("app.core.manager.ModelManager._get_worker_class")
     def test_start_model_no_worker_class(self, mock_get_worker, mock_process_cls, fresh_manager):
         """Test error when worker class not found."""
         mock_get_worker.return_value = None
         
-        with pytest.raises(ValueError) as excinfo:
+        with pytest.raises(ValueError, match="No worker implementation"):
             fresh_manager.start_model("zipformer")
-        assert "No worker implementation" in str(excinfo.value)
     
-    @patch("app.core.manager.multiprocessing.Process")
+    @pytest.mark.xdist_group("mgr_proc")
+    @patch.object(_MP_CONTEXT_TYPE, "Process")
     @patch("app.core.manager.ModelManager._get_worker_class")
     def test_start_model_idempotent(self, mock_get_worker, mock_process_cls, fresh_manager):
         """Test that starting same model twice doesn't create duplicate processes."""
@@ -117,29 +120,42 @@ class TestModelManager:
         # Process should only be created once
         assert mock_process_cls.call_count == 1
     
+    @pytest.mark.xdist_group("mgr_proc")
     @patch("app.core.manager.ModelManager._get_worker_class")
-    def test_stop_model(self, mock_get_worker, fresh_manager):
-        """Test stopping a running model."""
+    def test_stop_and_restart_model(self, mock_get_worker, fresh_manager):
+        """Test start -> stop -> start -> stop, each stop graceful and complete."""
         mock_worker_cls = MagicMock()
         mock_get_worker.return_value = mock_worker_cls
         
-        with patch("app.core.manager.multiprocessing.Process") as mock_process_cls:
-            mock_process_instance = MagicMock()
-            mock_process_instance.is_alive.return_value = False
-            mock_process_cls.return_value = mock_process_instance
+        with patch.object(_MP_CONTEXT_TYPE, "Process") as mock_process_cls:
+            first, second = MagicMock(), MagicMock()
+            first.is_alive.return_value = False
+            second.is_alive.return_value = False
+            mock_process_cls.side_effect = [first, second]
             
-            # Start then stop
-            fresh_manager.start_model("zipformer")
-            fresh_manager.stop_current_model()
+            for process in (first, second):
+                fresh_manager.start_model("zipformer")
+                assert fresh_manager.active_processes["zipformer"] is process
+                input_q = fresh_manager.input_queues["zipformer"]
+                
+                with patch.object(input_q, "put_nowait", wraps=input_q.put_nowait) as put_nowait:
+                    fresh_manager.stop_current_model()
+                
+                # Graceful: STOP sent and joined, never terminated
+                put_nowait.assert_called_once_with("STOP")
+                process.join.assert_called()
+                process.terminate.assert_not_called()
+                
+                # Verify cleanup
+                assert "zipformer" not in fresh_manager.active_processes
+                assert "zipformer" not in fresh_manager.input_queues
+                assert "zipformer" not in fresh_manager.output_queues
+                assert fresh_manager.current_model is None
             
-            # Verify cleanup
-            assert "zipformer" not in fresh_manager.active_processes
-            assert "zipformer" not in fresh_manager.input_queues
-            assert "zipformer" not in fresh_manager.output_queues
-            assert fresh_manager.current_model is None
-            mock_process_instance.join.assert_called()
+            assert mock_process_cls.call_count == 2
     
-    @patch("app.core.manager.multiprocessing.Process")
+    @pytest.mark.xdist_group("mgr_proc")
+    @patch.object(_MP_CONTEXT_TYPE, "Process")
     @patch("app.core.manager.ModelManager._get_worker_class")
     def test_get_queues(self, mock_get_worker, mock_process_cls, fresh_manager):
         """Test getting queues for running model."""
@@ -155,6 +171,60 @@ class TestModelManager:
         assert input_q is not None
         assert output_q is not None
     
+    @pytest.mark.xdist_group("mgr_proc")
+    @patch.object(_MP_CONTEXT_TYPE, "Process")
+    @patch("app.core.manager.ModelManager._get_worker_class")
+    def test_model_ready_event(self, mock_get_worker, mock_process_cls, fresh_manager):
+        """Test status reports ready only once the worker sets its ready event."""
+        mock_worker_cls = MagicMock()
+        mock_get_worker.return_value = mock_worker_cls
+        
+        fresh_manager.start_model("zipformer")
+        
+        ready_event = mock_worker_cls.call_args.kwargs["ready_event"]
+        assert fresh_manager.is_model_ready("zipformer") is False
+        assert fresh_manager.get_status() == "loading"
+        
+        ready_event.set()  # What the child does after load_model()
+        assert fresh_manager.is_model_ready("zipformer") is True
+        assert fresh_manager.get_status() == "ready"
+
+    @pytest.mark.xdist_group("mgr_proc")
+    @patch.object(_MP_CONTEXT_TYPE, "Process")
+    @patch("app.core.manager.ModelManager._get_worker_class")
+    def test_audio_ring_shared_with_worker(self, mock_get_worker, mock_process_cls, fresh_manager):
+        """Test the worker gets the model's audio ring and stop() releases it."""
+        mock_worker_cls = MagicMock()
+        mock_get_worker.return_value = mock_worker_cls
+        mock_process_cls.return_value.is_alive.return_value = False
+        
+        fresh_manager.start_model("zipformer")
+        
+        ring = fresh_manager.get_audio_ring("zipformer")
+        assert ring is not None
+        assert mock_worker_cls.call_args.kwargs["audio_ring"] is ring
+        assert fresh_manager.get_audio_ring("other") is None
+        
+        fresh_manager.stop_current_model()
+        assert fresh_manager.audio_rings == {}
+
+    @patch.object(ModelManager, "start_span_detector")
+    @patch.object(ModelManager, "start_model")
+    def test_preload_skips_span_detector_when_moderation_off(self, mock_start_model, mock_start_detector, fresh_manager):
+        """Test the span detector is not loaded at startup unless moderation is on."""
+        fresh_manager._moderation_enabled = False
+        fresh_manager.preload_all_models()
+        mock_start_model.assert_called_once_with("zipformer")
+        mock_start_detector.assert_not_called()
+
+        fresh_manager._moderation_enabled = True
+        fresh_manager.preload_all_models()
+        mock_start_detector.assert_called_once_with("visobert-hsd-span")
+
+    def test_is_model_ready_not_started(self, fresh_manager):
+        """Test a model that was never started is not ready."""
+        assert fresh_manager.is_model_ready("zipformer") is False
+    
     def test_get_queues_wrong_model(self, fresh_manager):
         """Test getting queues for non-running model returns None."""
         input_q, output_q = fresh_manager.get_queues("zipformer")
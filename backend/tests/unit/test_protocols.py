@@ -274,6 +274,7 @@ class TestWebSocketConfigSchema:
         assert config.model == "zipformer"
         assert config.sample_rate == 16000
         assert config.moderation is True  # Default enabled
+        assert config.stream_mode == "batched"
     
     def test_moderation_disabled(self):
         """Test WebSocket config with moderation disabled."""
@@ -0,0 +1,64 @@
+"""
+Unit tests for SharedAudioRing.
+
+Tests the shared-memory audio ring's ability to:
+- Copy PCM chunks into free slots and read them back without copying
+- Fall back (return None) when a chunk is too large, no slot is free or the
+  ring has been closed
+- Recycle released slots
+"""
+import pytest
+import numpy as np
+
+from app.workers.shared_audio import AudioSlot, SharedAudioRing
+
+
+class TestSharedAudioRing:
+    """Test suite for SharedAudioRing."""
+    
+    @pytest.fixture
+    def ring(self):
+        """Small ring (2 slots x 1KB), destroyed after each test."""
+        ring = SharedAudioRing(n_slots=2, bytes_per_slot=1024)
+        yield ring
+        ring.close()
+        ring.unlink()
+    
+    def test_write_and_view_roundtrip(self, ring):
+        """Test samples written to a slot are readable as an int16 view."""
+        pcm = np.arange(-256, 256, dtype=np.int16)
+        
+        slot = ring.write(pcm.tobytes())
+        
+        assert slot == AudioSlot(slot.index, 1024)
+        view = ring.view(slot)
+        assert view.dtype == np.int16
+        np.testing.assert_array_equal(view, pcm)
+        del view  # drop the buffer export before the fixture closes the ring
+    
+    def test_write_oversized_chunk_falls_back(self, ring):
+        """Test chunks larger than a slot are not parked."""
+        assert ring.write(bytes(1026)) is None
+    
+    def test_write_when_full_falls_back(self, ring):
+        """Test write returns None once every slot is in use."""
+        first = ring.write(bytes(10))
+        second = ring.write(bytes(10))
+        
+        assert {first.index, second.index} == {0, 1}
+        assert ring.write(bytes(10)) is None
+    
+    def test_release_recycles_slot(self, ring):
+        """Test a released slot can be written again immediately."""
+        slots = [ring.write(bytes(10)), ring.write(bytes(10))]
+        ring.release(slots[0])
+        
+        slot = ring.write(bytes(10))
+        assert slot is not None
+        assert slot.index == slots[0].index
+    
+    def test_write_after_close_falls_back(self, ring):
+        """Test a ring closed by a model stop makes write return None, not raise."""
+        ring.close()
+        
+        assert ring.write(bytes(10)) is None
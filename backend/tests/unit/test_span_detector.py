@@ -12,11 +12,6 @@ with real model are in tests/integration/ directory.
 """
 import pytest
 from unittest.mock import MagicMock, patch
-import sys
-import os
-
-# Add backend to sys.path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
 
 from app.workers.span_detector import SpanDetectorWorker
 
@@ -243,6 +238,107 @@ class TestProcessMethod:
         worker.process({"text": "ab", "request_id": "test"})
         worker.output_queue.put.assert_not_called()
 
+    def test_process_bytes_in_bytes_out(self, worker):
+        """Test process decodes orjson bytes and emits orjson bytes."""
+        import orjson
+
+        worker._detect_spans = MagicMock(return_value={"request_id": "req-1", "label": "CLEAN"})
+        worker.process(orjson.dumps({"text": "xin chào", "request_id": "req-1"}))
+
+        worker._detect_spans.assert_called_once_with("xin chào", "req-1")
+        payload = worker.output_queue.put.call_args[0][0]
+        assert isinstance(payload, bytes)
+        result = orjson.loads(payload)
+        assert result["request_id"] == "req-1"
+        assert result["label"] == "CLEAN"
+        assert "latency_ms" in result
+
+    def test_process_micro_batches_queued_requests(self):
+        """Test queued requests share one batched detection, tagged by request_id."""
+        import orjson
+        import queue
+
+        input_q = queue.Queue()
+        worker = SpanDetectorWorker(input_q, MagicMock(), "visobert-hsd-span")
+        for i in (2, 3):
+            input_q.put(orjson.dumps({"text": f"câu số {i}", "request_id": f"req-{i}"}))
+
+        worker._detect_spans_batch = MagicMock(side_effect=lambda texts, ids: [
+            {"request_id": rid, "label": "CLEAN"} for rid in ids
+        ])
+        worker.process(orjson.dumps({"text": "câu số 1", "request_id": "req-1"}))
+
+        worker._detect_spans_batch.assert_called_once_with(
+            ["câu số 1", "câu số 2", "câu số 3"], ["req-1", "req-2", "req-3"]
+        )
+        ids = [orjson.loads(c[0][0])["request_id"] for c in worker.output_queue.put.call_args_list]
+        assert ids == ["req-1", "req-2", "req-3"]
+
+    def test_process_malformed_item_does_not_sink_batch(self):
+        """Test a bad payload gets an encoded error while its batch-mates are still answered."""
+        import orjson
+        import queue
+
+        input_q = queue.Queue()
+        input_q.put(b"{not json")
+        input_q.put(orjson.dumps({"text": "câu số 2", "request_id": "req-2"}))
+        worker = SpanDetectorWorker(input_q, MagicMock(), "visobert-hsd-span")
+        worker._detect_spans_batch = MagicMock(side_effect=lambda texts, ids: [
+            {"request_id": rid, "label": "CLEAN"} for rid in ids
+        ])
+
+        worker.process(orjson.dumps({"text": "câu số 1", "request_id": "req-1"}))
+
+        results = [orjson.loads(c[0][0]) for c in worker.output_queue.put.call_args_list]
+        assert results[0]["request_id"] is None
+        assert results[0]["error"].startswith("Malformed request")
+        assert [r["request_id"] for r in results[1:]] == ["req-1", "req-2"]
+
+    def test_process_stop_during_batch_ends_worker(self):
+        """Test a STOP signal gathered mid-batch stops the loop after the batch."""
+        import queue
+
+        input_q = queue.Queue()
+        input_q.put("STOP")
+        worker = SpanDetectorWorker(input_q, MagicMock(), "visobert-hsd-span")
+        worker._detect_spans = MagicMock(return_value={"request_id": "req-1"})
+
+        worker.process({"text": "xin chào", "request_id": "req-1"})
+
+        worker._detect_spans.assert_called_once_with("xin chào", "req-1")
+        assert worker.is_running is False
+
+    def test_run_error_result_is_encoded(self):
+        """Test run()'s error path uses the same orjson wire format as results."""
+        import orjson
+        import queue
+
+        input_q = queue.Queue()
+        input_q.put(orjson.dumps({"text": "xin chào", "request_id": "req-1"}))
+        input_q.put("STOP")
+        worker = SpanDetectorWorker(input_q, MagicMock(), "visobert-hsd-span")
+
+        with patch.object(worker, "load_model"), \
+             patch.object(worker, "process", side_effect=RuntimeError("boom")):
+            worker.run()
+
+        payload = worker.output_queue.put.call_args[0][0]
+        assert orjson.loads(payload) == {"error": "boom", "model": "visobert-hsd-span"}
+
+    def test_moderate_batch_single_forward_pass(self):
+        """Test moderate_batch runs all texts through one batched detection."""
+        worker = SpanDetectorWorker(MagicMock(), MagicMock(), "visobert-hsd-span")
+        worker._detect_spans_batch = MagicMock(side_effect=lambda texts, ids: [
+            {"request_id": rid, "text_length": len(text)} for text, rid in zip(texts, ids)
+        ])
+
+        results = worker.moderate_batch(["xin chào", "đồ ngu"])
+
+        worker._detect_spans_batch.assert_called_once_with(["xin chào", "đồ ngu"], [None, None])
+        assert [r["text_length"] for r in results] == [8, 6]
+        assert worker.moderate_batch([]) == []
+        worker.output_queue.put.assert_not_called()
+
 
 class TestModelLoading:
     """Test model loading functionality."""
@@ -272,15 +368,37 @@ class TestModelLoading:
                 except Exception:
                     pass  # Expected since we're mocking
     
+    @patch("os.path.exists")
+    @patch("os.listdir")
+    def test_load_model_session_options(self, mock_listdir, mock_exists, worker):
+        """Test the ONNX session gets full graph optimization and a thread budget."""
+        mock_exists.return_value = True
+        mock_listdir.return_value = ["model_quantized.onnx"]
+        mock_ort = MagicMock()
+        mock_optimum = MagicMock()
+        
+        with patch.dict("sys.modules", {
+            "onnxruntime": mock_ort,
+            "optimum.onnxruntime": mock_optimum,
+            "transformers": MagicMock(),
+        }):
+            worker.load_model()
+        
+        from_pretrained = mock_optimum.ORTModelForTokenClassification.from_pretrained
+        kwargs = from_pretrained.call_args.kwargs
+        assert kwargs["file_name"] == "model_quantized.onnx"
+        session_options = kwargs["session_options"]
+        assert session_options is mock_ort.SessionOptions.return_value
+        assert session_options.graph_optimization_level == mock_ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        assert session_options.intra_op_num_threads == SpanDetectorWorker.NUM_THREADS
+    
     @patch("os.path.exists")
     def test_load_model_raises_if_not_found(self, mock_exists, worker):
         """Test FileNotFoundError when model not found."""
         mock_exists.return_value = False
         
-        with pytest.raises(FileNotFoundError) as exc_info:
+        with pytest.raises(FileNotFoundError, match="(?i)visobert-hsd-span"):
             worker.load_model()
-        
-        assert "visobert-hsd-span" in str(exc_info.value).lower()
 
 
 class TestLabelInference:
@@ -9,14 +9,10 @@ Tests the Zipformer worker's ability to:
 """
 import pytest
 from unittest.mock import MagicMock, patch
-import sys
-import os
 import numpy as np
 
-# Add backend to sys.path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
-
 from app.workers.zipformer import ZipformerWorker
+from tests.audio_samples import SILENCE_1S, SILENCE_HALF_S
 
 
 class TestZipformerWorker:
@@ -35,6 +31,16 @@ class TestZipformerWorker:
         input_q, output_q = mock_queues
         return ZipformerWorker(input_q, output_q, "zipformer")
 
+    def test_worker_creation(self):
+        """Test worker construction only assigns state (no queue access)."""
+        worker = ZipformerWorker(None, None, "zipformer")
+        
+        assert worker.model_name == "zipformer"
+        assert worker.is_running is True
+        assert worker.recognizer is None
+        assert worker.stream is None
+        assert worker.audio_ring is None
+
     @patch("os.path.exists")
     def test_load_model_success(self, mock_exists, worker):
         """Test successful model loading."""
@@ -46,7 +52,7 @@ class TestZipformerWorker:
         mock_sherpa.OfflineRecognizer.from_transducer.return_value = mock_recognizer
         mock_recognizer.create_stream.return_value = MagicMock()
         
-        with patch.dict("sys.modules", {"sherpa_onnx": mock_sherpa}):
+        with patch("app.workers.zipformer.sherpa_onnx", mock_sherpa):
             worker.load_model()
         
         # Verify sherpa was called with correct args
@@ -64,10 +70,16 @@ class TestZipformerWorker:
         """Test error when model files are missing."""
         mock_exists.return_value = False
         
-        with patch.dict("sys.modules", {"sherpa_onnx": MagicMock()}):
+        with patch("app.workers.zipformer.sherpa_onnx", MagicMock()):
             with pytest.raises(FileNotFoundError):
                 worker.load_model()
 
+    def test_load_model_without_sherpa(self, worker):
+        """Test a missing sherpa-onnx install surfaces as ModuleNotFoundError."""
+        with patch("app.workers.zipformer.sherpa_onnx", None):
+            with pytest.raises(ModuleNotFoundError):
+                worker.load_model()
+
     @patch("os.path.exists")
     def test_process_audio(self, mock_exists, worker):
         """Test audio processing flow."""
@@ -80,14 +92,14 @@ class TestZipformerWorker:
         mock_sherpa.OfflineRecognizer.from_transducer.return_value = mock_recognizer
         mock_recognizer.create_stream.return_value = mock_stream
         
-        with patch.dict("sys.modules", {"sherpa_onnx": mock_sherpa}):
+        with patch("app.workers.zipformer.sherpa_onnx", mock_sherpa):
             worker.load_model()
         
         # Mock recognition result
         mock_stream.result.text = "xin chào"
         
         # Create dummy audio data (16k samples = 1 second, int16)
-        audio_data = bytes(32000)
+        audio_data = SILENCE_1S
         
         # Process audio
         worker.process(audio_data)
@@ -119,11 +131,11 @@ class TestZipformerWorker:
         mock_recognizer.create_stream.return_value = mock_stream
         mock_stream.result.text = "test"
         
-        with patch.dict("sys.modules", {"sherpa_onnx": mock_sherpa}):
+        with patch("app.workers.zipformer.sherpa_onnx", mock_sherpa):
             worker.load_model()
         
         # Send dict with audio
-        worker.process({"audio": bytes(16000)})
+        worker.process({"audio": SILENCE_HALF_S})
         
         mock_stream.accept_waveform.assert_called_once()
 
@@ -136,7 +148,7 @@ class TestZipformerWorker:
         mock_recognizer = MagicMock()
         mock_sherpa.OfflineRecognizer.from_transducer.return_value = mock_recognizer
         
-        with patch.dict("sys.modules", {"sherpa_onnx": mock_sherpa}):
+        with patch("app.workers.zipformer.sherpa_onnx", mock_sherpa):
             worker.load_model()
             
         # Send reset command
@@ -157,20 +169,128 @@ class TestZipformerWorker:
         mock_recognizer.create_stream.return_value = mock_stream
         mock_stream.result.text = "test"
         
-        with patch.dict("sys.modules", {"sherpa_onnx": mock_sherpa}):
+        with patch("app.workers.zipformer.sherpa_onnx", mock_sherpa):
             worker.load_model()
         
         # Send reset with audio
-        worker.process({"reset": True, "audio": bytes(16000)})
+        worker.process({"reset": True, "audio": SILENCE_HALF_S})
         
         # Should reset stream AND process audio
         assert mock_recognizer.create_stream.call_count == 2
         mock_stream.accept_waveform.assert_called_once()
 
+    @patch("os.path.exists")
+    def test_process_coalesces_queued_audio(self, mock_exists):
+        """Test queued audio chunks share one decode and control items keep their order."""
+        import queue
+        
+        mock_exists.return_value = True
+        input_q = queue.Queue()
+        worker = ZipformerWorker(input_q, MagicMock(), "zipformer")
+        
+        mock_sherpa = MagicMock()
+        mock_recognizer = MagicMock()
+        mock_stream = MagicMock()
+        mock_sherpa.OfflineRecognizer.from_transducer.return_value = mock_recognizer
+        mock_recognizer.create_stream.return_value = mock_stream
+        mock_stream.result.text = "xin chào"
+        
+        with patch("app.workers.zipformer.sherpa_onnx", mock_sherpa):
+            worker.load_model()
+        
+        input_q.put(bytes(3200))
+        input_q.put(bytes(3200))
+        input_q.put({"flush": True})
+        input_q.put(bytes(3200))
+        
+        worker.process(bytes(3200))
+        
+        mock_stream.accept_waveform.assert_called_once()
+        assert len(mock_stream.accept_waveform.call_args[0][1]) == 3 * 1600
+        mock_recognizer.decode_stream.assert_called_once_with(mock_stream)
+        assert list(worker._backlog) == [{"flush": True}]
+        assert input_q.qsize() == 1
+
+    def test_process_reads_shared_memory_slots(self):
+        """Test AudioSlot items are decoded from the ring and their slots released."""
+        import queue
+        from app.workers.shared_audio import AudioSlot, SharedAudioRing
+        
+        ring = SharedAudioRing(n_slots=4, bytes_per_slot=3200)
+        try:
+            input_q = queue.Queue()
+            worker = ZipformerWorker(input_q, MagicMock(), "zipformer", audio_ring=ring)
+            worker.recognizer = MagicMock()
+            worker.stream = MagicMock()
+            worker.stream.result.text = ""
+            
+            first = ring.write(np.full(1600, 16384, dtype=np.int16).tobytes())
+            input_q.put(ring.write(bytes(3200)))
+            ring.release = MagicMock(wraps=ring.release)
+            
+            worker.process(first)
+            
+            samples = worker.stream.accept_waveform.call_args[0][1]
+            assert samples.dtype == np.float32
+            assert len(samples) == 2 * 1600
+            assert samples[0] == 0.5 and samples[-1] == 0.0
+            assert ring.release.call_count == 2
+            assert all(isinstance(c[0][0], AudioSlot) for c in ring.release.call_args_list)
+        finally:
+            ring.close()
+            ring.unlink()
+
+    def test_run_sets_ready_event_after_load(self):
+        """Test run() signals readiness once the model has loaded."""
+        import threading
+        
+        input_q = MagicMock()
+        input_q.get.return_value = "STOP"
+        ready_event = threading.Event()
+        worker = ZipformerWorker(input_q, MagicMock(), "zipformer", ready_event=ready_event)
+        
+        with patch.object(worker, "load_model"):
+            worker.run()
+        
+        assert ready_event.is_set()
+
+    def test_run_warms_up_before_ready(self):
+        """Test run() finishes the warmup inference before signalling readiness."""
+        import threading
+        
+        input_q = MagicMock()
+        input_q.get.return_value = "STOP"
+        ready_event = threading.Event()
+        worker = ZipformerWorker(input_q, MagicMock(), "zipformer", ready_event=ready_event)
+        
+        seen = []
+        with patch.object(worker, "load_model"), \
+             patch.object(worker, "warmup", side_effect=lambda: seen.append(ready_event.is_set())):
+            worker.run()
+        
+        assert seen == [False]
+        assert ready_event.is_set()
+
+    def test_warmup_uses_throwaway_stream(self, worker):
+        """Test warmup decodes on its own stream and emits nothing."""
+        live_stream = MagicMock()
+        warmup_stream = MagicMock()
+        worker.recognizer = MagicMock()
+        worker.recognizer.create_stream.return_value = warmup_stream
+        worker.stream = live_stream
+        
+        worker.warmup()
+        
+        warmup_stream.accept_waveform.assert_called_once()
+        worker.recognizer.decode_stream.assert_called_once_with(warmup_stream)
+        assert worker.stream is live_stream
+        live_stream.accept_waveform.assert_not_called()
+        worker.output_queue.put.assert_not_called()
+
     def test_process_without_model(self, worker):
         """Test process returns early if model not loaded."""
         worker.recognizer = None
-        worker.process(bytes(16000))
+        worker.process(SILENCE_HALF_S)
         
         # Should not put anything in queue
         worker.output_queue.put.assert_not_called()
@@ -180,11 +300,9 @@ class TestVietnameseTextFormatting:
     """Test Vietnamese text formatting."""
     
     @pytest.fixture
-    def worker(self, mock_queues):
-        """Create worker instance."""
-        input_q = MagicMock()
-        output_q = MagicMock()
-        return ZipformerWorker(input_q, output_q, "zipformer")
+    def worker(self):
+        """Create worker instance (formatting never touches the queues)."""
+        return ZipformerWorker(None, None, "zipformer")
     
     def test_format_uppercase_to_sentence_case(self, worker):
         """Test converting uppercase to sentence case."""
@@ -0,0 +1,15 @@
+"""
+Decoding helpers for /ws/transcribe frames in WebSocket client tests.
+
+With the default "batched" stream mode the server coalesces messages
+produced close together into one {"events": [...]} frame; a lone message
+arrives unwrapped. Clients must unwrap before looking at "text"/"type".
+"""
+import json
+from typing import List
+
+
+def ws_events(frame: str) -> List[dict]:
+    """Decode one text frame into the messages it carries."""
+    data = json.loads(frame)
+    return data["events"] if "events" in data else [data]
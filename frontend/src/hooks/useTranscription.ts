@@ -439,59 +439,69 @@ export function useTranscription(options: UseTranscriptionOptions) {
     if (lastMessage === null) return
 
     try {
-      const data = JSON.parse(lastMessage.data)
-      
-      // Handle moderation result
-      if (data.type === 'moderation') {
-        const moderationResult: ModerationResult = {
-          ...data,
-          detected_keywords: data.detected_keywords ?? [],  // Ensure array fallback
-        } as ModerationResult
-        setState((prev) => ({
-          ...prev,
-          latestModeration: moderationResult,
-          moderationResults: [...prev.moderationResults, moderationResult],
-        }))
-        onModeration?.(moderationResult)
-        const keywordsInfo = moderationResult.detected_keywords.length > 0 
-          ? `, keywords: [${moderationResult.detected_keywords.join(', ')}]` 
-          : ''
-        console.log('[WS] Moderation result:', moderationResult.label, `(${(moderationResult.confidence * 100).toFixed(1)}%)${keywordsInfo}`)
-        return
-      }
-      
-      // Handle transcription response
-      const response: TranscriptionResponse = data
-      
-      setState((prev) => {
-        let newInterim = prev.interimText
-        let newSegments = [...prev.finalizedSegments]
-
-        if (response.is_final) {
-          // Add to finalized segments
-          if (response.text.trim()) {
-            newSegments.push(response.text.trim())
-          }
-          newInterim = ''
-        } else {
-          // Update interim text
-          newInterim = response.text
+      const parsed = JSON.parse(lastMessage.data)
+      // Server may coalesce several messages into one frame: {"events": [...]}
+      const events = Array.isArray(parsed.events) ? parsed.events : [parsed]
+
+      for (const data of events) {
+        // Pong inside a batched frame (single pongs are handled by the filter)
+        if (data.type === 'pong' && 'timestamp' in data) {
+          handlePong(data.timestamp)
+          continue
         }
 
-        // Build full transcript
-        const fullTranscript = [...newSegments, newInterim]
-          .filter(Boolean)
-          .join(' ')
-
-        return {
-          ...prev,
-          interimText: newInterim,
-          finalizedSegments: newSegments,
-          fullTranscript,
+        // Handle moderation result
+        if (data.type === 'moderation') {
+          const moderationResult: ModerationResult = {
+            ...data,
+            detected_keywords: data.detected_keywords ?? [],  // Ensure array fallback
+          } as ModerationResult
+          setState((prev) => ({
+            ...prev,
+            latestModeration: moderationResult,
+            moderationResults: [...prev.moderationResults, moderationResult],
+          }))
+          onModeration?.(moderationResult)
+          const keywordsInfo = moderationResult.detected_keywords.length > 0 
+            ? `, keywords: [${moderationResult.detected_keywords.join(', ')}]` 
+            : ''
+          console.log('[WS] Moderation result:', moderationResult.label, `(${(moderationResult.confidence * 100).toFixed(1)}%)${keywordsInfo}`)
+          continue
         }
-      })
+        
+        // Handle transcription response
+        const response: TranscriptionResponse = data
+        
+        setState((prev) => {
+          let newInterim = prev.interimText
+          let newSegments = [...prev.finalizedSegments]
+
+          if (response.is_final) {
+            // Add to finalized segments
+            if (response.text.trim()) {
+              newSegments.push(response.text.trim())
+            }
+            newInterim = ''
+          } else {
+            // Update interim text
+            newInterim = response.text
+          }
 
-      onTranscription?.(response)
+          // Build full transcript
+          const fullTranscript = [...newSegments, newInterim]
+            .filter(Boolean)
+            .join(' ')
+
+          return {
+            ...prev,
+            interimText: newInterim,
+            finalizedSegments: newSegments,
+            fullTranscript,
+          }
+        })
+
+        onTranscription?.(response)
+      }
     } catch (error) {
       console.error('[WS] Failed to parse message:', error)
     }